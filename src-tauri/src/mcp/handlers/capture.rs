@@ -121,7 +121,7 @@ pub async fn handle_capture_list_windows(
             let text = if response.is_string() {
                 response.as_str().unwrap_or("").to_string()
             } else {
-                serde_json::to_string_pretty(&response)
+                serde_json::to_string(&response)
                     .unwrap_or_else(|_| format!("{:?}", response))
             };
             McpToolResult::text(text)
@@ -172,7 +172,7 @@ pub async fn handle_capture_window(
                 McpToolResult::image(base64.to_string(), content_type.to_string())
             } else {
                 // Fallback: return as text if no image data
-                let text = serde_json::to_string_pretty(&response)
+                let text = serde_json::to_string(&response)
                     .unwrap_or_else(|_| format!("{:?}", response));
                 McpToolResult::error(format!(
                     "Capture succeeded but no image data returned: {}",
@@ -226,7 +226,7 @@ pub async fn handle_capture_browser(
                 });
                 result
             } else {
-                let text = serde_json::to_string_pretty(&response)
+                let text = serde_json::to_string(&response)
                     .unwrap_or_else(|_| format!("{:?}", response));
                 McpToolResult::error(format!(
                     "Browser capture succeeded but no image data returned: {}",
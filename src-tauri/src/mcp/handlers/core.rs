@@ -133,15 +133,18 @@ fn trigger_path(data_dir: &Path) -> PathBuf {
 
 /// Read and parse a JSON file, returning a default value if the file doesn't exist or is corrupt.
 async fn read_json_file<T: serde::de::DeserializeOwned>(path: &Path, default: T) -> T {
-    match tokio::fs::read_to_string(path).await {
-        Ok(data) => serde_json::from_str(&data).unwrap_or(default),
+    match tokio::fs::read(path).await {
+        Ok(data) => serde_json::from_slice(&data).unwrap_or(default),
         Err(_) => default,
     }
 }
 
 /// Write JSON data to a file atomically (write to .tmp, then rename).
+///
+/// Written compact: these files are only read by code, and the inbox is
+/// rewritten on every message, so indentation is pure extra I/O.
 async fn atomic_write_json<T: Serialize>(path: &Path, data: &T) -> Result<(), String> {
-    let json = serde_json::to_string_pretty(data)
+    let json = serde_json::to_vec(data)
         .map_err(|e| format!("Failed to serialize JSON: {}", e))?;
     let tmp_path = path.with_extension("json.tmp");
     tokio::fs::write(&tmp_path, &json)
@@ -385,8 +388,8 @@ pub async fn handle_voice_send(
 
     // Keep last MAX_MESSAGES messages
     if store.messages.len() > MAX_MESSAGES {
-        let start = store.messages.len() - MAX_MESSAGES;
-        store.messages = store.messages[start..].to_vec();
+        let excess = store.messages.len() - MAX_MESSAGES;
+        store.messages.drain(..excess);
     }
 
     if let Err(e) = atomic_write_json(&path, &store).await {
@@ -469,8 +472,8 @@ pub async fn handle_voice_inbox(args: &Value, data_dir: &Path) -> McpToolResult
 
     // Cap at MAX_INBOX_TOTAL
     if store.messages.len() > MAX_INBOX_TOTAL {
-        let start = store.messages.len() - MAX_INBOX_TOTAL;
-        store.messages = store.messages[start..].to_vec();
+        let excess = store.messages.len() - MAX_INBOX_TOTAL;
+        store.messages.drain(..excess);
     }
 
     // Mark as read if requested (do this BEFORE filtering to avoid borrow issues)
@@ -811,30 +814,30 @@ pub async fn handle_voice_status(args: &Value, data_dir: &Path) -> McpToolResult
             return McpToolResult::text("No active instances.");
         }
 
+        use std::fmt::Write as _;
+
         let store: StatusStore = read_json_file(&path, StatusStore { statuses: vec![] }).await;
         let now = now_ms();
 
-        let formatted: Vec<String> = store
-            .statuses
-            .iter()
-            .map(|s| {
-                let last_hb = parse_iso_to_ms(&s.last_heartbeat).unwrap_or(0);
-                let is_stale = (now - last_hb) > STALE_TIMEOUT_MS;
-                let stale_indicator = if is_stale { " [STALE]" } else { "" };
-                format!(
-                    "[{}] {}{} - {}",
-                    s.instance_id,
-                    s.status,
-                    stale_indicator,
-                    s.current_task.as_deref().unwrap_or("idle")
-                )
-            })
-            .collect();
+        let mut out = String::from("=== Claude Instances ===\n");
+        for s in &store.statuses {
+            let last_hb = parse_iso_to_ms(&s.last_heartbeat).unwrap_or(0);
+            let is_stale = (now - last_hb) > STALE_TIMEOUT_MS;
+            let stale_indicator = if is_stale { " [STALE]" } else { "" };
+            let _ = write!(
+                out,
+                "\n[{}] {}{} - {}",
+                s.instance_id,
+                s.status,
+                stale_indicator,
+                s.current_task.as_deref().unwrap_or("idle")
+            );
+        }
+        if store.statuses.is_empty() {
+            out.push('\n');
+        }
 
-        return McpToolResult::text(format!(
-            "=== Claude Instances ===\n\n{}",
-            formatted.join("\n")
-        ));
+        return McpToolResult::text(out);
     }
 
     // Update status
@@ -11,6 +11,7 @@
 //! - n8n API runs at `http://localhost:5678`
 //! - API key from `~/.config/n8n/api_key` or `N8N_API_KEY` env var
 
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
 use std::sync::Mutex;
@@ -18,7 +19,8 @@ use std::time::{Duration, Instant};
 
 use std::sync::LazyLock;
 
-use serde::Serialize;
+use serde::de::DeserializeOwned;
+use serde::{Deserialize, Serialize};
 use serde_json::{json, Value};
 use tracing::warn;
 
@@ -30,10 +32,16 @@ use super::McpToolResult;
 
 const N8N_API_URL: &str = "http://localhost:5678";
 const API_KEY_CACHE_TTL_SECS: u64 = 300; // 5 minutes
+const API_KEY_MISSING_TTL_SECS: u64 = 10;
 
-/// Cached API key with TTL.
-static API_KEY_CACHE: LazyLock<Mutex<(Option<String>, Instant)>> =
-    LazyLock::new(|| Mutex::new((None, Instant::now())));
+const API_KEY_MISSING_MSG: &str =
+    "n8n API key not configured. Set in ~/.config/n8n/api_key or N8N_API_KEY env var.";
+
+/// Cached API key lookup with TTL (`None` until the first lookup).
+/// A missing key is cached too, briefly, so a misconfigured setup does not
+/// hit the filesystem on every tool call.
+static API_KEY_CACHE: LazyLock<Mutex<Option<(Option<String>, Instant)>>> =
+    LazyLock::new(|| Mutex::new(None));
 
 /// Get the n8n API key file path.
 fn api_key_file_path() -> PathBuf {
@@ -49,8 +57,11 @@ fn get_api_key() -> Option<String> {
     let mut cache = API_KEY_CACHE.lock().unwrap_or_else(|e| e.into_inner());
 
     // Check cache freshness
-    if cache.0.is_some() && cache.1.elapsed() < Duration::from_secs(API_KEY_CACHE_TTL_SECS) {
-        return cache.0.clone();
+    if let Some((key, fetched_at)) = cache.as_ref() {
+        let ttl = if key.is_some() { API_KEY_CACHE_TTL_SECS } else { API_KEY_MISSING_TTL_SECS };
+        if fetched_at.elapsed() < Duration::from_secs(ttl) {
+            return key.clone();
+        }
     }
 
     // Try file first
@@ -58,7 +69,7 @@ fn get_api_key() -> Option<String> {
     if let Ok(content) = fs::read_to_string(&key_path) {
         let key = content.trim().to_string();
         if !key.is_empty() {
-            *cache = (Some(key.clone()), Instant::now());
+            *cache = Some((Some(key.clone()), Instant::now()));
             return Some(key);
         }
     }
@@ -66,12 +77,12 @@ fn get_api_key() -> Option<String> {
     // Fall back to environment variable
     if let Ok(key) = std::env::var("N8N_API_KEY") {
         if !key.is_empty() {
-            *cache = (Some(key.clone()), Instant::now());
+            *cache = Some((Some(key.clone()), Instant::now()));
             return Some(key);
         }
     }
 
-    *cache = (None, Instant::now());
+    *cache = Some((None, Instant::now()));
     None
 }
 
@@ -79,17 +90,33 @@ fn get_api_key() -> Option<String> {
 // HTTP Client
 // ============================================
 
-/// Make an API request to the n8n REST API.
-async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Result<Value, String> {
-    let api_key = get_api_key()
-        .ok_or_else(|| "n8n API key not configured. Set in ~/.config/n8n/api_key or N8N_API_KEY env var.".to_string())?;
+/// Shared client for the n8n REST API, webhooks and the template API.
+///
+/// Each tool call sends its own request, so successive calls reuse pooled
+/// keep-alive connections instead of reconnecting every time. Request
+/// timeouts are set per request; the shared connect timeout makes a call
+/// to an unreachable host fail fast instead of using its whole request
+/// budget.
+static HTTP_CLIENT: LazyLock<reqwest::Client> = LazyLock::new(|| {
+    reqwest::Client::builder()
+        .connect_timeout(Duration::from_secs(5))
+        .build()
+        .unwrap_or_else(|e| {
+            warn!("Failed to build n8n HTTP client, using defaults: {}", e);
+            reqwest::Client::new()
+        })
+});
 
-    let url = format!("{}/api/v1{}", N8N_API_URL, endpoint);
+/// Send a request to the n8n REST API and return the successful response.
+async fn send_api_request(
+    endpoint: &str,
+    method: &str,
+    body: Option<Value>,
+) -> Result<reqwest::Response, String> {
+    let api_key = get_api_key().ok_or(API_KEY_MISSING_MSG)?;
 
-    let client = reqwest::Client::builder()
-        .timeout(Duration::from_secs(30))
-        .build()
-        .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
+    let url = format!("{}/api/v1{}", N8N_API_URL, endpoint);
+    let client = &*HTTP_CLIENT;
 
     let mut req_builder = match method {
         "POST" => client.post(&url),
@@ -100,6 +127,7 @@ async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Resul
     };
 
     req_builder = req_builder
+        .timeout(Duration::from_secs(30))
         .header("X-N8N-API-KEY", &api_key)
         .header("Content-Type", "application/json");
 
@@ -123,18 +151,34 @@ async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Resul
     let status = response.status();
 
     if status.is_success() {
-        let text = response.text().await.map_err(|e| format!("Failed to read response: {}", e))?;
-        if text.is_empty() {
-            Ok(Value::Null)
-        } else {
-            serde_json::from_str(&text).map_err(|_| text)
-        }
+        Ok(response)
     } else {
         let body_text = response.text().await.unwrap_or_default();
         Err(format!("API error: {} - {}", status.as_u16(), body_text))
     }
 }
 
+/// Make an API request to the n8n REST API.
+async fn api_request(endpoint: &str, method: &str, body: Option<Value>) -> Result<Value, String> {
+    let response = send_api_request(endpoint, method, body).await?;
+    let bytes = response.bytes().await.map_err(|e| format!("Failed to read response: {}", e))?;
+    if bytes.is_empty() {
+        Ok(Value::Null)
+    } else {
+        serde_json::from_slice(&bytes).map_err(|_| String::from_utf8_lossy(&bytes).into_owned())
+    }
+}
+
+/// GET a list endpoint and decode its items straight from the body.
+///
+/// Fields not present on `T` (workflow `nodes`, `connections`, ...) are
+/// skipped by the parser instead of being built into a `Value` tree.
+async fn api_list<T: DeserializeOwned>(endpoint: &str) -> Result<Vec<T>, String> {
+    let response = send_api_request(endpoint, "GET", None).await?;
+    let bytes = response.bytes().await.map_err(|e| format!("Failed to read response: {}", e))?;
+    parse_list(&bytes)
+}
+
 /// Make a raw HTTP request (for webhooks / external URLs).
 async fn raw_request(
     url: &str,
@@ -155,10 +199,7 @@ async fn raw_request(
         ));
     }
 
-    let client = reqwest::Client::builder()
-        .timeout(Duration::from_secs(timeout_secs))
-        .build()
-        .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
+    let client = &*HTTP_CLIENT;
 
     let mut req_builder = match method {
         "POST" => client.post(url),
@@ -167,7 +208,9 @@ async fn raw_request(
         _ => client.get(url),
     };
 
-    req_builder = req_builder.header("Content-Type", "application/json");
+    req_builder = req_builder
+        .timeout(Duration::from_secs(timeout_secs))
+        .header("Content-Type", "application/json");
 
     if let Some(data) = body {
         req_builder = req_builder.json(&data);
@@ -177,11 +220,13 @@ async fn raw_request(
     let status = response.status();
 
     if status.is_success() {
-        let text = response.text().await.map_err(|e| format!("Failed to read: {}", e))?;
-        if text.is_empty() {
+        let bytes = response.bytes().await.map_err(|e| format!("Failed to read: {}", e))?;
+        if bytes.is_empty() {
             Ok(Value::Null)
         } else {
-            serde_json::from_str(&text).unwrap_or(Ok(Value::String(text)))
+            // Webhooks may answer with plain text; pass it through as a string.
+            Ok(serde_json::from_slice(&bytes)
+                .unwrap_or_else(|_| Value::String(String::from_utf8_lossy(&bytes).into_owned())))
         }
     } else {
         Err(format!("HTTP {}", status.as_u16()))
@@ -193,16 +238,88 @@ async fn raw_request(
 // ============================================
 
 fn ok_result(result: Value) -> McpToolResult {
-    let text = serde_json::to_string_pretty(&result).unwrap_or_else(|_| format!("{:?}", result));
+    let text = serde_json::to_string(&result).unwrap_or_else(|_| format!("{:?}", result));
     McpToolResult::text(text)
 }
 
 fn err_result(message: &str) -> McpToolResult {
     let error_json = json!({ "success": false, "error": message });
-    let text = serde_json::to_string_pretty(&error_json).unwrap_or_else(|_| message.to_string());
+    let text = serde_json::to_string(&error_json).unwrap_or_else(|_| message.to_string());
     McpToolResult::error(text)
 }
 
+// ============================================
+// API records
+// ============================================
+
+/// List endpoint payload: `{ "data": [...] }`.
+#[derive(Debug, Deserialize)]
+struct ListEnvelope<T> {
+    #[serde(default = "Vec::new")]
+    data: Vec<T>,
+}
+
+/// Decode a list endpoint body into typed records.
+///
+/// The body is parsed in a single pass straight into `T`, so unknown fields
+/// are skipped rather than buffered. n8n wraps lists in `{ "data": [...] }`;
+/// some versions answer `/tags` with a bare array, recognized by its first
+/// byte. An empty body is an empty list, as in `api_request`.
+fn parse_list<T: DeserializeOwned>(bytes: &[u8]) -> Result<Vec<T>, String> {
+    let body = bytes.trim_ascii_start();
+    let items = match body.first() {
+        None => return Ok(Vec::new()),
+        Some(b'[') => serde_json::from_slice::<Vec<T>>(body),
+        Some(_) => serde_json::from_slice::<ListEnvelope<T>>(body).map(|list| list.data),
+    };
+    items.map_err(|e| format!("Unexpected list response: {}", e))
+}
+
+/// Workflow entry from `GET /workflows` (only the fields we report).
+#[derive(Debug, Deserialize, Serialize)]
+struct WorkflowSummary {
+    #[serde(default)]
+    id: Value,
+    #[serde(default)]
+    name: Option<String>,
+    #[serde(default)]
+    active: Option<bool>,
+    #[serde(rename = "createdAt", default)]
+    created_at: Option<String>,
+    #[serde(rename = "updatedAt", default)]
+    updated_at: Option<String>,
+}
+
+/// Execution entry from `GET /executions`.
+#[derive(Debug, Deserialize, Serialize)]
+struct ExecutionSummary {
+    #[serde(default)]
+    id: Value,
+    #[serde(rename = "workflowId", default)]
+    workflow_id: Value,
+    #[serde(default)]
+    status: Option<String>,
+    #[serde(rename = "startedAt", default)]
+    started_at: Option<String>,
+    #[serde(rename = "stoppedAt", default)]
+    stopped_at: Option<String>,
+    #[serde(default)]
+    mode: Option<String>,
+}
+
+/// Tag entry from `GET /tags`.
+#[derive(Debug, Deserialize, Serialize)]
+struct TagSummary {
+    #[serde(default)]
+    id: Value,
+    #[serde(default)]
+    name: Option<String>,
+    #[serde(rename = "createdAt", default)]
+    created_at: Option<String>,
+    #[serde(rename = "updatedAt", default)]
+    updated_at: Option<String>,
+}
+
 // ============================================
 // Node Knowledge Base
 // ============================================
@@ -308,32 +425,61 @@ fn common_nodes() -> Vec<(&'static str, NodeInfo)> {
     ]
 }
 
+/// Knowledge base entry with its lowercased description for matching.
+struct NodeEntry {
+    key: &'static str,
+    info: NodeInfo,
+    description_lower: String,
+}
+
+/// The knowledge base, built once on first search.
+static COMMON_NODES: LazyLock<Vec<NodeEntry>> = LazyLock::new(|| {
+    common_nodes()
+        .into_iter()
+        .map(|(key, info)| NodeEntry {
+            key,
+            description_lower: info.description.to_lowercase(),
+            info,
+        })
+        .collect()
+});
+
+/// Comma-separated knowledge base keys for the "no match" hint.
+///
+/// Lists every key in COMMON_NODES. The old hand-written hint named only
+/// 11 of the 14 and left out google, calendar and respond.
+static NODE_KEYS_HINT: LazyLock<String> = LazyLock::new(|| {
+    COMMON_NODES
+        .iter()
+        .map(|entry| entry.key)
+        .collect::<Vec<_>>()
+        .join(", ")
+});
+
 // ============================================
 // Node Discovery Handlers
 // ============================================
 
 pub async fn handle_n8n_search_nodes(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let query = args_val
+    let query = args
         .get("query")
         .and_then(|v| v.as_str())
         .unwrap_or("")
         .to_lowercase();
-    let limit = args_val
+    let limit = args
         .get("limit")
         .and_then(|v| v.as_u64())
         .unwrap_or(10)
         .clamp(1, 100) as usize;
 
-    let nodes = common_nodes();
-    let results: Vec<&NodeInfo> = nodes
+    let results: Vec<&NodeInfo> = COMMON_NODES
         .iter()
-        .filter(|(key, node)| {
-            query.contains(key)
-                || key.contains(query.as_str())
-                || node.description.to_lowercase().contains(&query)
+        .filter(|entry| {
+            query.contains(entry.key)
+                || entry.key.contains(query.as_str())
+                || entry.description_lower.contains(&query)
         })
-        .map(|(_, node)| node)
+        .map(|entry| &entry.info)
         .take(limit)
         .collect();
 
@@ -347,14 +493,13 @@ pub async fn handle_n8n_search_nodes(args: &Value, _data_dir: &Path) -> McpToolR
         ok_result(json!({
             "success": true,
             "results": [],
-            "hint": format!("No common nodes match '{}'. Try: gmail, webhook, http, slack, discord, github, code, set, if, switch, schedule", query)
+            "hint": format!("No common nodes match '{}'. Try: {}", query, *NODE_KEYS_HINT)
         }))
     }
 }
 
 pub async fn handle_n8n_get_node(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let node_type = match args_val.get("node_type").and_then(|v| v.as_str()) {
+    let node_type = match args.get("node_type").and_then(|v| v.as_str()) {
         Some(t) => t,
         None => return err_result("node_type required"),
     };
@@ -376,39 +521,16 @@ pub async fn handle_n8n_get_node(args: &Value, _data_dir: &Path) -> McpToolResul
 // ============================================
 
 pub async fn handle_n8n_list_workflows(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let active_only = args_val
+    let active_only = args
         .get("active_only")
         .and_then(|v| v.as_bool())
         .unwrap_or(false);
 
-    match api_request("/workflows", "GET", None).await {
-        Ok(result) => {
-            let workflows = result
-                .get("data")
-                .and_then(|d| d.as_array())
-                .cloned()
-                .unwrap_or_default();
-
-            let filtered: Vec<Value> = workflows
-                .into_iter()
-                .filter(|w| {
-                    if active_only {
-                        w.get("active").and_then(|a| a.as_bool()).unwrap_or(false)
-                    } else {
-                        true
-                    }
-                })
-                .map(|w| {
-                    json!({
-                        "id": w.get("id"),
-                        "name": w.get("name"),
-                        "active": w.get("active"),
-                        "createdAt": w.get("createdAt"),
-                        "updatedAt": w.get("updatedAt"),
-                    })
-                })
-                .collect();
+    match api_list::<WorkflowSummary>("/workflows").await {
+        Ok(mut filtered) => {
+            if active_only {
+                filtered.retain(|w| w.active.unwrap_or(false));
+            }
 
             ok_result(json!({
                 "success": true,
@@ -421,8 +543,7 @@ pub async fn handle_n8n_list_workflows(args: &Value, _data_dir: &Path) -> McpToo
 }
 
 pub async fn handle_n8n_get_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let workflow_id = match args_val.get("workflow_id") {
+    let workflow_id = match args.get("workflow_id") {
         Some(v) => v.to_string().trim_matches('"').to_string(),
         None => return err_result("workflow_id required"),
     };
@@ -455,19 +576,17 @@ pub async fn handle_n8n_get_workflow(args: &Value, _data_dir: &Path) -> McpToolR
 }
 
 pub async fn handle_n8n_create_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let name = match args_val.get("name").and_then(|v| v.as_str()) {
+    let name = match args.get("name").and_then(|v| v.as_str()) {
         Some(n) => n.to_string(),
         None => return err_result("name required"),
     };
 
-    let nodes = match args_val.get("nodes") {
+    let nodes = match args.get("nodes") {
         Some(n) => n.clone(),
         None => return err_result("nodes required"),
     };
 
-    let connections = args_val.get("connections").cloned().unwrap_or(json!({}));
+    let connections = args.get("connections").cloned().unwrap_or(json!({}));
 
     let body = json!({
         "name": name,
@@ -490,15 +609,13 @@ pub async fn handle_n8n_create_workflow(args: &Value, _data_dir: &Path) -> McpTo
 }
 
 pub async fn handle_n8n_update_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let workflow_id = match extract_string_or_number(&args_val, "workflow_id") {
+    let workflow_id = match extract_string_or_number(args, "workflow_id") {
         Some(id) => id,
         None => return err_result("workflow_id required"),
     };
 
     // Mode 1: Full workflow update
-    if let Some(workflow_data) = args_val.get("workflow_data") {
+    if let Some(workflow_data) = args.get("workflow_data") {
         // Fetch existing workflow first
         let existing = match api_request(&format!("/workflows/{}", workflow_id), "GET", None).await {
             Ok(e) => e,
@@ -528,11 +645,19 @@ pub async fn handle_n8n_update_workflow(args: &Value, _data_dir: &Path) -> McpTo
     }
 
     // Mode 2: Operations
-    let operations = match args_val.get("operations").and_then(|v| v.as_array()) {
+    let operations = match args.get("operations").and_then(|v| v.as_array()) {
         Some(ops) if !ops.is_empty() => ops.clone(),
         _ => return err_result("Either operations or workflow_data required"),
     };
 
+    // (De)activation returns as soon as it is reached, so when it comes first
+    // the workflow body is never used -- skip fetching it.
+    match operations[0].get("type").and_then(|v| v.as_str()) {
+        Some("activateWorkflow") => return set_workflow_active(&workflow_id, true).await,
+        Some("deactivateWorkflow") => return set_workflow_active(&workflow_id, false).await,
+        _ => {}
+    }
+
     // Fetch existing workflow
     let existing = match api_request(&format!("/workflows/{}", workflow_id), "GET", None).await {
         Ok(e) => e,
@@ -556,18 +681,8 @@ pub async fn handle_n8n_update_workflow(args: &Value, _data_dir: &Path) -> McpTo
         let op_type = op.get("type").and_then(|v| v.as_str()).unwrap_or("");
 
         match op_type {
-            "activateWorkflow" => {
-                return match api_request(&format!("/workflows/{}/activate", workflow_id), "POST", None).await {
-                    Ok(_) => ok_result(json!({ "success": true, "message": "Workflow activated", "active": true })),
-                    Err(e) => err_result(&format!("Activation failed: {}", e)),
-                };
-            }
-            "deactivateWorkflow" => {
-                return match api_request(&format!("/workflows/{}/deactivate", workflow_id), "POST", None).await {
-                    Ok(_) => ok_result(json!({ "success": true, "message": "Workflow deactivated", "active": false })),
-                    Err(e) => err_result(&format!("Deactivation failed: {}", e)),
-                };
-            }
+            "activateWorkflow" => return set_workflow_active(&workflow_id, true).await,
+            "deactivateWorkflow" => return set_workflow_active(&workflow_id, false).await,
             "updateNode" => {
                 let node_name = op.get("nodeName").and_then(|v| v.as_str()).unwrap_or("");
                 if let Some(idx) = nodes.iter().position(|n| n.get("name").and_then(|v| v.as_str()) == Some(node_name)) {
@@ -720,9 +835,23 @@ pub async fn handle_n8n_update_workflow(args: &Value, _data_dir: &Path) -> McpTo
     }
 }
 
+/// Activate or deactivate a workflow.
+async fn set_workflow_active(workflow_id: &str, active: bool) -> McpToolResult {
+    if active {
+        match api_request(&format!("/workflows/{}/activate", workflow_id), "POST", None).await {
+            Ok(_) => ok_result(json!({ "success": true, "message": "Workflow activated", "active": true })),
+            Err(e) => err_result(&format!("Activation failed: {}", e)),
+        }
+    } else {
+        match api_request(&format!("/workflows/{}/deactivate", workflow_id), "POST", None).await {
+            Ok(_) => ok_result(json!({ "success": true, "message": "Workflow deactivated", "active": false })),
+            Err(e) => err_result(&format!("Deactivation failed: {}", e)),
+        }
+    }
+}
+
 pub async fn handle_n8n_delete_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let workflow_id = match extract_string_or_number(&args_val, "workflow_id") {
+    let workflow_id = match extract_string_or_number(args, "workflow_id") {
         Some(id) => id,
         None => return err_result("workflow_id required"),
     };
@@ -749,9 +878,7 @@ pub async fn handle_n8n_delete_workflow(args: &Value, _data_dir: &Path) -> McpTo
 }
 
 pub async fn handle_n8n_validate_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let (nodes, connections) = if let Some(id) = extract_string_or_number(&args_val, "workflow_id") {
+    let (nodes, connections) = if let Some(id) = extract_string_or_number(args, "workflow_id") {
         match api_request(&format!("/workflows/{}", id), "GET", None).await {
             Ok(result) => {
                 let n = result.get("nodes").and_then(|v| v.as_array()).cloned().unwrap_or_default();
@@ -760,7 +887,7 @@ pub async fn handle_n8n_validate_workflow(args: &Value, _data_dir: &Path) -> Mcp
             }
             Err(e) => return err_result(&e),
         }
-    } else if let Some(wf_json) = args_val.get("workflow_json") {
+    } else if let Some(wf_json) = args.get("workflow_json") {
         let n = wf_json.get("nodes").and_then(|v| v.as_array()).cloned().unwrap_or_default();
         let c = wf_json.get("connections").cloned().unwrap_or(json!({}));
         (n, c)
@@ -822,11 +949,9 @@ pub async fn handle_n8n_validate_workflow(args: &Value, _data_dir: &Path) -> Mcp
 }
 
 pub async fn handle_n8n_trigger_workflow(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let workflow_id = extract_string_or_number(&args_val, "workflow_id");
-    let mut webhook_path = args_val.get("webhook_path").and_then(|v| v.as_str()).map(|s| s.to_string());
-    let data = args_val.get("data").cloned().unwrap_or(json!({}));
+    let workflow_id = extract_string_or_number(args, "workflow_id");
+    let mut webhook_path = args.get("webhook_path").and_then(|v| v.as_str()).map(|s| s.to_string());
+    let data = args.get("data").cloned().unwrap_or(json!({}));
 
     if workflow_id.is_none() && webhook_path.is_none() {
         return err_result("Either workflow_id or webhook_path required");
@@ -888,9 +1013,7 @@ pub async fn handle_n8n_trigger_workflow(args: &Value, _data_dir: &Path) -> McpT
 }
 
 pub async fn handle_n8n_deploy_template(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let template_id = match extract_string_or_number(&args_val, "template_id") {
+    let template_id = match extract_string_or_number(args, "template_id") {
         Some(id) => id,
         None => return err_result("template_id required"),
     };
@@ -909,7 +1032,7 @@ pub async fn handle_n8n_deploy_template(args: &Value, _data_dir: &Path) -> McpTo
         return err_result("Template has no workflow data");
     }
 
-    let workflow_name = args_val
+    let workflow_name = args
         .get("name")
         .and_then(|v| v.as_str())
         .or_else(|| outer_workflow.get("name").and_then(|v| v.as_str()))
@@ -930,46 +1053,24 @@ pub async fn handle_n8n_deploy_template(args: &Value, _data_dir: &Path) -> McpTo
 // ============================================
 
 pub async fn handle_n8n_get_executions(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let limit = args_val
+    let limit = args
         .get("limit")
         .and_then(|v| v.as_u64())
         .unwrap_or(10)
         .clamp(1, 100);
 
     let mut params = vec![format!("limit={}", limit)];
-    if let Some(wf_id) = extract_string_or_number(&args_val, "workflow_id") {
+    if let Some(wf_id) = extract_string_or_number(args, "workflow_id") {
         params.push(format!("workflowId={}", wf_id));
     }
-    if let Some(status) = args_val.get("status").and_then(|v| v.as_str()) {
+    if let Some(status) = args.get("status").and_then(|v| v.as_str()) {
         params.push(format!("status={}", status));
     }
 
     let endpoint = format!("/executions?{}", params.join("&"));
 
-    match api_request(&endpoint, "GET", None).await {
-        Ok(result) => {
-            let executions = result
-                .get("data")
-                .and_then(|d| d.as_array())
-                .cloned()
-                .unwrap_or_default();
-
-            let mapped: Vec<Value> = executions
-                .iter()
-                .map(|e| {
-                    json!({
-                        "id": e.get("id"),
-                        "workflowId": e.get("workflowId"),
-                        "status": e.get("status"),
-                        "startedAt": e.get("startedAt"),
-                        "stoppedAt": e.get("stoppedAt"),
-                        "mode": e.get("mode"),
-                    })
-                })
-                .collect();
-
+    match api_list::<ExecutionSummary>(&endpoint).await {
+        Ok(mapped) => {
             ok_result(json!({
                 "success": true,
                 "count": mapped.len(),
@@ -981,13 +1082,12 @@ pub async fn handle_n8n_get_executions(args: &Value, _data_dir: &Path) -> McpToo
 }
 
 pub async fn handle_n8n_get_execution(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let execution_id = match extract_string_or_number(&args_val, "execution_id") {
+    let execution_id = match extract_string_or_number(args, "execution_id") {
         Some(id) => id,
         None => return err_result("execution_id required"),
     };
 
-    let include_data = args_val
+    let include_data = args
         .get("include_data")
         .and_then(|v| v.as_bool())
         .unwrap_or(false);
@@ -1031,8 +1131,7 @@ pub async fn handle_n8n_get_execution(args: &Value, _data_dir: &Path) -> McpTool
 }
 
 pub async fn handle_n8n_delete_execution(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let execution_id = match extract_string_or_number(&args_val, "execution_id") {
+    let execution_id = match extract_string_or_number(args, "execution_id") {
         Some(id) => id,
         None => return err_result("execution_id required"),
     };
@@ -1050,13 +1149,12 @@ pub async fn handle_n8n_delete_execution(args: &Value, _data_dir: &Path) -> McpT
 }
 
 pub async fn handle_n8n_retry_execution(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let execution_id = match extract_string_or_number(&args_val, "execution_id") {
+    let execution_id = match extract_string_or_number(args, "execution_id") {
         Some(id) => id,
         None => return err_result("execution_id required"),
     };
 
-    let load_workflow = args_val
+    let load_workflow = args
         .get("load_workflow")
         .and_then(|v| v.as_bool())
         .unwrap_or(true);
@@ -1097,19 +1195,17 @@ pub async fn handle_n8n_list_credentials(_args: &Value, _data_dir: &Path) -> Mcp
 }
 
 pub async fn handle_n8n_create_credential(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-
-    let name = match args_val.get("name").and_then(|v| v.as_str()) {
+    let name = match args.get("name").and_then(|v| v.as_str()) {
         Some(n) => n.to_string(),
         None => return err_result("name required"),
     };
 
-    let cred_type = match args_val.get("type").and_then(|v| v.as_str()) {
+    let cred_type = match args.get("type").and_then(|v| v.as_str()) {
         Some(t) => t.to_string(),
         None => return err_result("type required (e.g., 'slackApi', 'gmailOAuth2')"),
     };
 
-    let data = args_val.get("data").cloned().unwrap_or(json!({}));
+    let data = args.get("data").cloned().unwrap_or(json!({}));
 
     let body = json!({
         "name": name,
@@ -1132,8 +1228,7 @@ pub async fn handle_n8n_create_credential(args: &Value, _data_dir: &Path) -> Mcp
 }
 
 pub async fn handle_n8n_delete_credential(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let credential_id = match extract_string_or_number(&args_val, "credential_id") {
+    let credential_id = match extract_string_or_number(args, "credential_id") {
         Some(id) => id,
         None => return err_result("credential_id required"),
     };
@@ -1150,14 +1245,49 @@ pub async fn handle_n8n_delete_credential(args: &Value, _data_dir: &Path) -> Mcp
     }
 }
 
+/// How long a fetched credential schema is reused. Schemas are defined by
+/// the installed node packages and only change when n8n is upgraded.
+const CREDENTIAL_SCHEMA_TTL_SECS: u64 = 600;
+/// Upper bound on cached schemas; there are a few hundred credential types.
+const CREDENTIAL_SCHEMA_CACHE_MAX: usize = 64;
+
+/// Credential type -> (schema, fetched at).
+static CREDENTIAL_SCHEMA_CACHE: LazyLock<Mutex<HashMap<String, (Value, Instant)>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Fetch a credential schema, serving repeat lookups from a TTL cache.
+async fn credential_schema(credential_type: &str) -> Result<Value, String> {
+    let ttl = Duration::from_secs(CREDENTIAL_SCHEMA_TTL_SECS);
+    {
+        let cache = CREDENTIAL_SCHEMA_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((schema, fetched_at)) = cache.get(credential_type) {
+            if fetched_at.elapsed() < ttl {
+                return Ok(schema.clone());
+            }
+        }
+    }
+
+    let schema =
+        api_request(&format!("/credentials/schema/{}", credential_type), "GET", None).await?;
+
+    let mut cache = CREDENTIAL_SCHEMA_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= CREDENTIAL_SCHEMA_CACHE_MAX {
+        cache.retain(|_, (_, fetched_at)| fetched_at.elapsed() < ttl);
+        if cache.len() >= CREDENTIAL_SCHEMA_CACHE_MAX {
+            cache.clear();
+        }
+    }
+    cache.insert(credential_type.to_string(), (schema.clone(), Instant::now()));
+    Ok(schema)
+}
+
 pub async fn handle_n8n_get_credential_schema(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let credential_type = match args_val.get("credential_type").and_then(|v| v.as_str()) {
+    let credential_type = match args.get("credential_type").and_then(|v| v.as_str()) {
         Some(t) => t.to_string(),
         None => return err_result("credential_type required (e.g., 'gmailOAuth2', 'slackApi')"),
     };
 
-    match api_request(&format!("/credentials/schema/{}", credential_type), "GET", None).await {
+    match credential_schema(&credential_type).await {
         Ok(result) => {
             let required = result.get("required").cloned().unwrap_or(json!([]));
             ok_result(json!({
@@ -1181,35 +1311,41 @@ pub async fn handle_n8n_get_credential_schema(args: &Value, _data_dir: &Path) ->
 // Tags Management Handlers
 // ============================================
 
-pub async fn handle_n8n_list_tags(_args: &Value, _data_dir: &Path) -> McpToolResult {
-    match api_request("/tags", "GET", None).await {
-        Ok(result) => {
-            let tags = if result.is_array() {
-                result.as_array().cloned().unwrap_or_default()
-            } else {
-                result
-                    .get("data")
-                    .and_then(|d| d.as_array())
-                    .cloned()
-                    .unwrap_or_default()
-            };
-
-            let mapped: Vec<Value> = tags
-                .iter()
-                .map(|t| {
-                    json!({
-                        "id": t.get("id"),
-                        "name": t.get("name"),
-                        "createdAt": t.get("createdAt"),
-                        "updatedAt": t.get("updatedAt"),
-                    })
-                })
-                .collect();
+/// How long a fetched tag list is reused. The tag tools below clear it, so
+/// only edits made in the n8n UI can be up to this stale.
+const TAG_LIST_TTL_SECS: u64 = 60;
 
+/// Last `GET /tags` result as (tags, fetched at).
+static TAG_LIST_CACHE: Mutex<Option<(Value, Instant)>> = Mutex::new(None);
+
+fn invalidate_tag_list() {
+    *TAG_LIST_CACHE.lock().unwrap_or_else(|e| e.into_inner()) = None;
+}
+
+/// Fetch the tag list, serving repeat lookups from a TTL cache.
+async fn tag_list() -> Result<Value, String> {
+    {
+        let cache = TAG_LIST_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((tags, fetched_at)) = cache.as_ref() {
+            if fetched_at.elapsed() < Duration::from_secs(TAG_LIST_TTL_SECS) {
+                return Ok(tags.clone());
+            }
+        }
+    }
+
+    let tags = json!(api_list::<TagSummary>("/tags").await?);
+    let mut cache = TAG_LIST_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    *cache = Some((tags.clone(), Instant::now()));
+    Ok(tags)
+}
+
+pub async fn handle_n8n_list_tags(_args: &Value, _data_dir: &Path) -> McpToolResult {
+    match tag_list().await {
+        Ok(tags) => {
             ok_result(json!({
                 "success": true,
-                "count": mapped.len(),
-                "tags": mapped,
+                "count": tags.as_array().map_or(0, Vec::len),
+                "tags": tags,
             }))
         }
         Err(e) => err_result(&e),
@@ -1217,8 +1353,7 @@ pub async fn handle_n8n_list_tags(_args: &Value, _data_dir: &Path) -> McpToolRes
 }
 
 pub async fn handle_n8n_create_tag(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let name = match args_val.get("name").and_then(|v| v.as_str()) {
+    let name = match args.get("name").and_then(|v| v.as_str()) {
         Some(n) => n.to_string(),
         None => return err_result("name required"),
     };
@@ -1227,6 +1362,7 @@ pub async fn handle_n8n_create_tag(args: &Value, _data_dir: &Path) -> McpToolRes
 
     match api_request("/tags", "POST", Some(body)).await {
         Ok(result) => {
+            invalidate_tag_list();
             ok_result(json!({
                 "success": true,
                 "tag_id": result.get("id"),
@@ -1238,14 +1374,16 @@ pub async fn handle_n8n_create_tag(args: &Value, _data_dir: &Path) -> McpToolRes
 }
 
 pub async fn handle_n8n_delete_tag(args: &Value, _data_dir: &Path) -> McpToolResult {
-    let args_val = args.clone();
-    let tag_id = match extract_string_or_number(&args_val, "tag_id") {
+    let tag_id = match extract_string_or_number(args, "tag_id") {
         Some(id) => id,
         None => return err_result("tag_id required"),
     };
 
     match api_request(&format!("/tags/{}", tag_id), "DELETE", None).await {
-        Ok(_) => ok_result(json!({ "success": true, "message": format!("Tag {} deleted", tag_id) })),
+        Ok(_) => {
+            invalidate_tag_list();
+            ok_result(json!({ "success": true, "message": format!("Tag {} deleted", tag_id) }))
+        }
         Err(e) => {
             if e.contains("404") {
                 err_result("Tag not found")
@@ -1326,10 +1464,67 @@ mod tests {
         assert_eq!(extract_string_or_number(&val, "id"), None);
     }
 
+    #[test]
+    fn test_parse_list_envelope_and_bare() {
+        let envelope = br#"{"data":[{"id":"1","name":"A","active":true,"nodes":[{"x":1}]}]}"#;
+        let workflows: Vec<WorkflowSummary> = parse_list(envelope).unwrap();
+        assert_eq!(workflows.len(), 1);
+        assert_eq!(workflows[0].name.as_deref(), Some("A"));
+        assert_eq!(workflows[0].active, Some(true));
+
+        let tags: Vec<TagSummary> = parse_list(br#"[{"id":7,"name":"urgent"}]"#).unwrap();
+        assert_eq!(tags.len(), 1);
+        assert_eq!(tags[0].id, json!(7));
+        assert!(tags[0].created_at.is_none());
+
+        let missing: Vec<TagSummary> = parse_list(b"{}").unwrap();
+        assert!(missing.is_empty());
+        let empty: Vec<TagSummary> = parse_list(b"").unwrap();
+        assert!(empty.is_empty());
+    }
+
+    #[test]
+    fn test_parse_list_reports_bad_bodies() {
+        assert!(parse_list::<TagSummary>(b"<html>502 Bad Gateway</html>").is_err());
+        // One malformed record fails the list instead of hiding it.
+        let body = br#"{"data":[{"id":"1","name":"A"},{"id":"2","createdAt":5}]}"#;
+        assert!(parse_list::<WorkflowSummary>(body).is_err());
+    }
+
+    #[test]
+    fn test_workflow_summary_serializes_api_field_names() {
+        let summary = WorkflowSummary {
+            id: json!("1"),
+            name: Some("A".into()),
+            active: Some(false),
+            created_at: None,
+            updated_at: Some("2024-01-01T00:00:00Z".into()),
+        };
+        let out = serde_json::to_value(&summary).unwrap();
+        assert_eq!(out["createdAt"], Value::Null);
+        assert_eq!(out["updatedAt"], json!("2024-01-01T00:00:00Z"));
+    }
+
     #[test]
     fn test_common_nodes_not_empty() {
         let nodes = common_nodes();
         assert!(!nodes.is_empty());
         assert!(nodes.len() >= 10);
     }
+
+    #[test]
+    fn test_common_nodes_lowercased_once() {
+        assert_eq!(COMMON_NODES.len(), common_nodes().len());
+        let http = COMMON_NODES.iter().find(|e| e.key == "http").unwrap();
+        assert_eq!(http.description_lower, "make http requests to any api");
+        assert_eq!(http.info.description, "Make HTTP requests to any API");
+    }
+
+    #[test]
+    fn test_node_keys_hint_lists_every_key() {
+        for (key, _) in common_nodes() {
+            assert!(NODE_KEYS_HINT.contains(key), "hint missing {}", key);
+        }
+        assert!(NODE_KEYS_HINT.starts_with("gmail, webhook, http"));
+    }
 }
@@ -122,7 +122,7 @@ pub async fn handle_sandbox_snapshot(
             };
             if tree.is_empty() {
                 McpToolResult::text(
-                    serde_json::to_string_pretty(&resp).unwrap_or_else(|_| format!("{:?}", resp)),
+                    serde_json::to_string(&resp).unwrap_or_else(|_| format!("{:?}", resp)),
                 )
             } else {
                 let windows_line = if windows.is_empty() {
@@ -5,9 +5,10 @@
 //! methods: `initialize`, `initialized`, `tools/list`, `tools/call`.
 
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
 use serde_json::{json, Value};
-use std::sync::Arc;
-use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+use std::sync::{Arc, LazyLock};
+use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader, BufWriter};
 use tokio::sync::Mutex;
 use tracing::{error, info};
 
@@ -38,6 +39,9 @@ struct JsonRpcResponse {
     id: Value,
     #[serde(skip_serializing_if = "Option::is_none")]
     result: Option<Value>,
+    /// Pre-serialized result (tools/list), written out as `result`.
+    #[serde(rename = "result", skip_serializing_if = "Option::is_none")]
+    raw_result: Option<Box<RawValue>>,
     #[serde(skip_serializing_if = "Option::is_none")]
     error: Option<JsonRpcError>,
 }
@@ -67,6 +71,17 @@ impl JsonRpcResponse {
             jsonrpc: "2.0".into(),
             id,
             result: Some(result),
+            raw_result: None,
+            error: None,
+        }
+    }
+
+    fn success_raw(id: Value, result: Box<RawValue>) -> Self {
+        Self {
+            jsonrpc: "2.0".into(),
+            id,
+            result: None,
+            raw_result: Some(result),
             error: None,
         }
     }
@@ -76,6 +91,7 @@ impl JsonRpcResponse {
             jsonrpc: "2.0".into(),
             id,
             result: None,
+            raw_result: None,
             error: Some(JsonRpcError {
                 code,
                 message: message.into(),
@@ -138,20 +154,36 @@ pub async fn run_server(
 
     let stdin = tokio::io::stdin();
     let stdout = tokio::io::stdout();
-    let reader = BufReader::new(stdin);
-    let mut writer = stdout;
-    let mut lines = reader.lines();
+    // A 64 KiB read buffer takes a burst of queued requests, or a large
+    // workflow payload, in one read instead of 8 KiB at a time.
+    let mut reader = BufReader::with_capacity(64 * 1024, stdin);
+    // Responses are buffered and flushed once per request, so a response
+    // and the list_changed notification that follows it go out together.
+    let mut writer = BufWriter::new(stdout);
+    // One line buffer for the whole session; requests are parsed straight
+    // from its bytes.
+    let mut buf = Vec::new();
 
     eprintln!("Voice Mirror MCP server (Rust) running");
 
-    while let Ok(Some(line)) = lines.next_line().await {
-        let line = line.trim().to_string();
+    loop {
+        // Flush unconditionally: a response larger than the BufWriter's
+        // capacity bypasses its buffer, so an empty buffer doesn't mean
+        // everything has reached stdout.
+        flush_output(&mut writer).await;
+
+        buf.clear();
+        match reader.read_until(b'\n', &mut buf).await {
+            Ok(0) | Err(_) => break,
+            Ok(_) => {}
+        }
+        let line = buf.trim_ascii();
         if line.is_empty() {
             continue;
         }
 
         // Parse JSON-RPC request
-        let request: JsonRpcRequest = match serde_json::from_str(&line) {
+        let request: JsonRpcRequest = match serde_json::from_slice(line) {
             Ok(req) => req,
             Err(e) => {
                 let resp = JsonRpcResponse::error(
@@ -206,6 +238,7 @@ pub async fn run_server(
         }
     }
 
+    flush_output(&mut writer).await;
     eprintln!("MCP server stdin closed, shutting down");
     Ok(())
 }
@@ -265,19 +298,7 @@ fn handle_initialize(id: Value) -> JsonRpcResponse {
 
 /// Handle `tools/list` -- return currently loaded tool definitions.
 fn handle_tools_list(id: Value, state: &McpServerState) -> JsonRpcResponse {
-    let tools = state.registry.list_tools();
-    let tool_values: Vec<Value> = tools
-        .into_iter()
-        .map(|t| {
-            json!({
-                "name": t.name,
-                "description": t.description,
-                "inputSchema": t.input_schema,
-            })
-        })
-        .collect();
-
-    JsonRpcResponse::success(id, json!({ "tools": tool_values }))
+    JsonRpcResponse::success_raw(id, state.registry.tools_list_json().to_owned())
 }
 
 /// Handle `tools/call` -- dispatch to the appropriate tool handler.
@@ -286,12 +307,12 @@ async fn handle_tools_call(
     id: Value,
     params: &Value,
 ) -> JsonRpcResponse {
-    let tool_name = params
-        .get("name")
-        .and_then(|v| v.as_str())
-        .unwrap_or("")
-        .to_string();
-    let args = params.get("arguments").cloned().unwrap_or(json!({}));
+    static NO_ARGS: LazyLock<Value> = LazyLock::new(|| json!({}));
+
+    // Borrow name and arguments straight out of the request; tool calls
+    // can carry large payloads (workflow JSON) that don't need copying.
+    let tool_name = params.get("name").and_then(|v| v.as_str()).unwrap_or("");
+    let args = params.get("arguments").unwrap_or(&NO_ARGS);
 
     if tool_name.is_empty() {
         return JsonRpcResponse::error(id, -32602, "Missing tool name in params");
@@ -300,10 +321,10 @@ async fn handle_tools_call(
     // Record tool call and get data_dir + router
     let (data_dir, is_destructive, router) = {
         let mut state = state.lock().await;
-        state.registry.record_tool_call(&tool_name);
+        state.registry.record_tool_call(tool_name);
         (
             state.data_dir.clone(),
-            state.registry.is_destructive(&tool_name),
+            state.registry.is_destructive(tool_name),
             state.router.clone(),
         )
     };
@@ -323,7 +344,7 @@ async fn handle_tools_call(
     }
 
     // Route to handler
-    let result = route_tool_call(&tool_name, &args, &data_dir, state.clone(), router.as_ref()).await;
+    let result = route_tool_call(tool_name, args, &data_dir, state.clone(), router.as_ref()).await;
 
     // After tool execution, check for idle groups
     {
@@ -425,17 +446,21 @@ async fn route_tool_call(
     }
 }
 
-/// Write a JSON-RPC response to stdout (one line).
+/// Flush buffered responses to stdout.
+async fn flush_output<W: AsyncWriteExt + Unpin>(writer: &mut W) {
+    if let Err(e) = writer.flush().await {
+        error!("[MCP] Failed to flush stdout: {}", e);
+    }
+}
+
+/// Write a JSON-RPC response (one line). The caller flushes.
 async fn write_response<W: AsyncWriteExt + Unpin>(writer: &mut W, response: &JsonRpcResponse) {
-    match serde_json::to_string(response) {
-        Ok(json) => {
-            let line = format!("{}\n", json);
-            if let Err(e) = writer.write_all(line.as_bytes()).await {
+    match serde_json::to_vec(response) {
+        Ok(mut line) => {
+            line.push(b'\n');
+            if let Err(e) = writer.write_all(&line).await {
                 error!("[MCP] Failed to write response: {}", e);
             }
-            if let Err(e) = writer.flush().await {
-                error!("[MCP] Failed to flush stdout: {}", e);
-            }
         }
         Err(e) => {
             error!("[MCP] Failed to serialize response: {}", e);
@@ -443,20 +468,17 @@ async fn write_response<W: AsyncWriteExt + Unpin>(writer: &mut W, response: &Jso
     }
 }
 
-/// Write a JSON-RPC notification to stdout (no id, no response expected).
+/// Write a JSON-RPC notification (no id, no response expected). The caller flushes.
 async fn write_notification<W: AsyncWriteExt + Unpin>(
     writer: &mut W,
     notification: &JsonRpcNotification,
 ) {
-    match serde_json::to_string(notification) {
-        Ok(json) => {
-            let line = format!("{}\n", json);
-            if let Err(e) = writer.write_all(line.as_bytes()).await {
+    match serde_json::to_vec(notification) {
+        Ok(mut line) => {
+            line.push(b'\n');
+            if let Err(e) = writer.write_all(&line).await {
                 error!("[MCP] Failed to write notification: {}", e);
             }
-            if let Err(e) = writer.flush().await {
-                error!("[MCP] Failed to flush stdout: {}", e);
-            }
             info!("[MCP] Sent tools/list_changed notification");
         }
         Err(e) => {
@@ -502,7 +524,7 @@ mod tests {
             tools_changed: false,
         };
         let resp = handle_tools_list(json!(1), &state);
-        let result = resp.result.unwrap();
+        let result: Value = serde_json::from_str(resp.raw_result.unwrap().get()).unwrap();
         let tools = result["tools"].as_array().unwrap();
         // Default: core (5) + capture (11) = 16 always-loaded tools
         assert_eq!(tools.len(), 16);
@@ -548,7 +570,7 @@ mod tests {
             tools_changed: false,
         };
         let resp = handle_tools_list(json!(1), &state);
-        let result = resp.result.unwrap();
+        let result: Value = serde_json::from_str(resp.raw_result.unwrap().get()).unwrap();
         let tools = result["tools"].as_array().unwrap();
         // core (5) + capture (11) + browser (1) = 17
         assert!(tools.len() > 7, "Should have more than default 7 tools");
@@ -5,9 +5,11 @@
 //! Tools are organized into groups that can be loaded/unloaded at runtime.
 
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
 use serde_json::{json, Value};
 use std::collections::{HashMap, HashSet};
 use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::OnceLock;
 use tracing::info;
 
 // Re-export the shared McpToolResult from handlers so server.rs can use it
@@ -71,6 +73,8 @@ pub struct ToolRegistry {
     group_keywords: HashMap<String, Vec<String>>,
     /// Destructive tools requiring confirmation.
     destructive_tools: HashSet<String>,
+    /// Serialized tools/list result, rebuilt lazily after `loaded` changes.
+    tools_list: OnceLock<Box<RawValue>>,
 }
 
 impl Default for ToolRegistry {
@@ -128,6 +132,7 @@ impl ToolRegistry {
             group_last_used: HashMap::new(),
             group_keywords,
             destructive_tools,
+            tools_list: OnceLock::new(),
         }
     }
 
@@ -143,6 +148,7 @@ impl ToolRegistry {
         }
         self.loaded = allowed.clone();
         self.allowed = Some(allowed);
+        self.tools_list.take();
         info!(
             "[MCP] Tool profile applied: {}",
             profile.groups.join(", ")
@@ -171,6 +177,7 @@ impl ToolRegistry {
         }
         self.loaded = allowed.clone();
         self.allowed = Some(allowed);
+        self.tools_list.take();
         info!(
             "[MCP] Enabled groups set: {}",
             names.join(", ")
@@ -188,6 +195,28 @@ impl ToolRegistry {
         tools
     }
 
+    /// The tools/list result (`{"tools": [...]}`), already serialized.
+    ///
+    /// Built once per loaded-group set; every method that changes `loaded`
+    /// clears it, so clients polling tools/list don't re-serialize the schemas.
+    pub fn tools_list_json(&self) -> &RawValue {
+        #[derive(Serialize)]
+        struct ToolsList<'a> {
+            tools: Vec<&'a ToolDef>,
+        }
+
+        self.tools_list.get_or_init(|| {
+            let tools = self
+                .loaded
+                .iter()
+                .filter_map(|name| self.groups.get(name))
+                .flat_map(|group| group.tools.iter())
+                .collect();
+            serde_json::value::to_raw_value(&ToolsList { tools })
+                .expect("tool definitions serialize to JSON")
+        })
+    }
+
     /// Check if a tool is destructive (requires confirmation).
     pub fn is_destructive(&self, tool_name: &str) -> bool {
         self.destructive_tools.contains(tool_name)
@@ -250,6 +279,7 @@ impl ToolRegistry {
         }
 
         self.loaded.insert(group_name.to_string());
+        self.tools_list.take();
         let count = TOTAL_CALL_COUNT.load(Ordering::Relaxed);
         self.group_last_used.insert(group_name.to_string(), count);
         info!("[MCP] Loaded tool group: {}", group_name);
@@ -291,6 +321,7 @@ impl ToolRegistry {
             .unwrap_or(0);
 
         self.loaded.remove(group_name);
+        self.tools_list.take();
         info!("[MCP] Unloaded tool group: {}", group_name);
         Ok(tool_count)
     }
@@ -334,6 +365,7 @@ impl ToolRegistry {
             }
 
             self.loaded.insert(group_name.clone());
+            self.tools_list.take();
             loaded.push(group_name.clone());
             info!(
                 "[MCP] Auto-loaded \"{}\" (intent: \"{}\")",
@@ -385,6 +417,7 @@ impl ToolRegistry {
 
         for name in &to_unload {
             self.loaded.remove(name);
+            self.tools_list.take();
             info!(
                 "[MCP] Auto-unloaded \"{}\" (idle for {}+ calls)",
                 name, IDLE_CALLS_THRESHOLD
@@ -971,6 +1004,26 @@ mod tests {
         assert!(!reg.is_tool_loaded("memory_search"));
     }
 
+    #[test]
+    fn test_tools_list_json_tracks_loaded_groups() {
+        fn tools(reg: &ToolRegistry) -> Vec<Value> {
+            let result: Value = serde_json::from_str(reg.tools_list_json().get()).unwrap();
+            result["tools"].as_array().unwrap().clone()
+        }
+
+        let mut reg = ToolRegistry::new();
+        assert_eq!(tools(&reg).len(), 16);
+
+        reg.load_group("memory").unwrap();
+        let listed = tools(&reg);
+        assert_eq!(listed.len(), 22);
+        assert!(listed.iter().any(|t| t["name"] == "memory_search"));
+        assert!(listed.iter().all(|t| t.get("inputSchema").is_some()));
+
+        reg.unload_group("memory").unwrap();
+        assert_eq!(tools(&reg).len(), 16);
+    }
+
     #[test]
     fn test_cannot_unload_always_loaded() {
         let mut reg = ToolRegistry::new();
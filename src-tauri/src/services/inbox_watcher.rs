@@ -309,7 +309,7 @@ pub fn write_inbox_message_with_image(
 
     // Atomic write: write to .tmp, then rename
     let tmp_path = inbox_path.with_extension("json.tmp");
-    let json = serde_json::to_string_pretty(&data)
+    let json = serde_json::to_vec(&data)
         .map_err(|e| format!("Failed to serialize inbox: {}", e))?;
     std::fs::write(&tmp_path, &json)
         .map_err(|e| format!("Failed to write inbox.tmp: {}", e))?;
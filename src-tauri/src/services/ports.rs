@@ -55,18 +55,21 @@ pub fn describe_port_holder(port: u16) -> String {
 
 /// Render a small text table of port rows for the MCP tool output.
 pub fn format_table(rows: &[PortInfo]) -> String {
+    use std::fmt::Write as _;
+
     if rows.is_empty() {
         return "No listening TCP ports found.".to_string();
     }
     let mut out = String::from("PORT   PID      STATE       PROCESS\n");
     for r in rows {
-        out.push_str(&format!(
-            "{:<6} {:<8} {:<11} {}\n",
+        let _ = writeln!(
+            out,
+            "{:<6} {:<8} {:<11} {}",
             r.port,
             r.pid,
             r.state,
             if r.process_name.is_empty() { "?" } else { &r.process_name }
-        ));
+        );
     }
     out
 }
@@ -14,6 +14,7 @@
 mod playback;
 mod ring_buffer;
 
+use std::collections::HashSet;
 use std::sync::atomic::{AtomicBool, AtomicU8, Ordering};
 use std::sync::{Arc, Mutex};
 use std::time::Duration;
@@ -136,6 +137,10 @@ pub(crate) struct PipelineShared {
     /// playback thread. When a new speak() cancels the old one, the old
     /// token stays true so the old playback thread stops draining.
     pub(crate) active_playback_cancel: Mutex<Option<Arc<AtomicBool>>>,
+    /// Notified when the TTS engine is returned or a speak() call leaves the
+    /// Speaking state, so a new speak() can wait for the previous one to wind
+    /// down without polling.
+    pub(crate) tts_idle: tokio::sync::Notify,
     /// Force-stop recording flag (PTT release / Toggle stop).
     /// When set, the processing loop immediately transitions Recording -> Processing.
     force_stop_recording: AtomicBool,
@@ -267,6 +272,7 @@ impl VoicePipeline {
             running: AtomicBool::new(true),
             tts_cancel: AtomicBool::new(false),
             active_playback_cancel: Mutex::new(None),
+            tts_idle: tokio::sync::Notify::new(),
             force_stop_recording: AtomicBool::new(false),
             force_cancel_recording: AtomicBool::new(false),
             app_handle: app_handle.clone(),
@@ -1100,34 +1106,37 @@ async fn run_stt_and_emit(shared: &Arc<PipelineShared>, audio: Vec<f32>) {
 
 /// List available audio input devices.
 pub fn list_input_devices() -> Vec<AudioDeviceInfo> {
-    let host = cpal::default_host();
-    let mut devices = Vec::new();
-    if let Ok(inputs) = host.input_devices() {
-        for (i, dev) in inputs.enumerate() {
-            if let Ok(name) = dev.name() {
-                devices.push(AudioDeviceInfo {
-                    id: i as i32,
-                    name,
-                });
-            }
-        }
+    match cpal::default_host().input_devices() {
+        Ok(inputs) => device_infos(inputs.map(|dev| dev.name().ok())),
+        Err(_) => Vec::new(),
     }
-    devices
 }
 
 /// List available audio output devices.
 pub fn list_output_devices() -> Vec<AudioDeviceInfo> {
-    let host = cpal::default_host();
-    let mut devices = Vec::new();
-    if let Ok(outputs) = host.output_devices() {
-        for (i, dev) in outputs.enumerate() {
-            if let Ok(name) = dev.name() {
-                devices.push(AudioDeviceInfo {
-                    id: i as i32,
-                    name,
-                });
-            }
+    match cpal::default_host().output_devices() {
+        Ok(outputs) => device_infos(outputs.map(|dev| dev.name().ok())),
+        Err(_) => Vec::new(),
+    }
+}
+
+/// Build the device list from enumerated names in a single pass.
+///
+/// Devices are selected by name, so a name the host reports more than once
+/// (common with ALSA) is listed only once, keeping its first index. Devices
+/// whose name can't be read are skipped.
+fn device_infos(names: impl Iterator<Item = Option<String>>) -> Vec<AudioDeviceInfo> {
+    let mut devices: Vec<AudioDeviceInfo> = Vec::new();
+    let mut seen: HashSet<String> = HashSet::new();
+    for (i, name) in names.enumerate() {
+        let Some(name) = name else { continue };
+        if !seen.insert(name.clone()) {
+            continue;
         }
+        devices.push(AudioDeviceInfo {
+            id: i as i32,
+            name,
+        });
     }
     devices
 }
@@ -1182,4 +1191,18 @@ mod tests {
         let devices = list_output_devices();
         let _ = devices;
     }
+
+    #[test]
+    fn test_device_infos_dedups_names() {
+        let names = vec![
+            Some("default".to_string()),
+            Some("Speakers".to_string()),
+            None,
+            Some("default".to_string()),
+            Some("Headset".to_string()),
+        ];
+        let devices = device_infos(names.into_iter());
+        let listed: Vec<(i32, &str)> = devices.iter().map(|d| (d.id, d.name.as_str())).collect();
+        assert_eq!(listed, vec![(0, "default"), (1, "Speakers"), (4, "Headset")]);
+    }
 }
@@ -8,6 +8,7 @@ use std::sync::Arc;
 use std::time::{Duration, Instant};
 
 use cpal::traits::{DeviceTrait, HostTrait};
+use futures_util::StreamExt;
 use rodio::{OutputStream, Sink};
 use tauri::Emitter;
 
@@ -95,16 +96,24 @@ pub(super) async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<()
             }
         }
         // Wait up to 2 seconds for the engine to be returned AND the previous
-        // playback handle to finish.
-        for _ in 0..40 {
-            tokio::time::sleep(Duration::from_millis(50)).await;
+        // playback handle to finish. Woken by restore_tts_engine() and
+        // finish_speaking() rather than polling, so we resume as soon as the
+        // previous request has wound down.
+        let deadline = tokio::time::Instant::now() + Duration::from_secs(2);
+        loop {
+            // Register for the wake-up before checking, so a notification
+            // between the check and the await is not missed.
+            let idle = shared.tts_idle.notified();
+            tokio::pin!(idle);
+            idle.as_mut().enable();
+
             let engine_available = shared.tts_engine.lock().map(|g| g.is_some()).unwrap_or(false);
             let no_longer_speaking = super::state_from_u8(shared.state.load(Ordering::Acquire)) != VoiceState::Speaking;
             if engine_available && no_longer_speaking {
                 break;
             }
-            if engine_available {
-                tokio::time::sleep(Duration::from_millis(100)).await;
+            if tokio::time::timeout_at(deadline, idle).await.is_err() {
+                tracing::debug!("Previous TTS request did not finish within 2s, continuing");
                 break;
             }
         }
@@ -170,9 +179,12 @@ pub(super) async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<()
         return result;
     }
 
-    // Streaming: synthesize phrase by phrase, queue in rodio Sink
+    // Streaming: synthesize phrases (up to `concurrency` in flight), queue in
+    // rodio Sink in order
+    let concurrency = engine.synthesis_concurrency().max(1);
     tracing::info!(
         phrases = phrases.len(),
+        concurrency,
         "Starting streaming TTS ({} phrases)",
         phrases.len()
     );
@@ -193,8 +205,17 @@ pub(super) async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<()
         )
     });
 
-    // Synthesize phrases and send to playback
-    for (i, phrase) in phrases.iter().enumerate() {
+    // Synthesize phrases and send to playback. `buffered` keeps up to
+    // `concurrency` syntheses running ahead of playback but yields results in
+    // phrase order; phrases not yet started are never started after a cancel.
+    let engine_ref: &dyn TtsEngine = engine.as_ref();
+    let mut synthesized = futures_util::stream::iter(phrases.into_iter().enumerate())
+        .map(|(i, phrase)| async move {
+            (i, tokio::time::timeout(SYNTH_TIMEOUT, engine_ref.synthesize(&phrase)).await)
+        })
+        .buffered(concurrency);
+
+    while let Some((i, result)) = synthesized.next().await {
         if shared.tts_cancel.load(Ordering::SeqCst) {
             tracing::info!("TTS cancelled during streaming synthesis");
             // Propagate to per-request token so playback thread also stops
@@ -202,7 +223,7 @@ pub(super) async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<()
             break;
         }
 
-        match tokio::time::timeout(SYNTH_TIMEOUT, engine.synthesize(phrase)).await {
+        match result {
             Ok(Ok(samples)) if !samples.is_empty() => {
                 tracing::debug!(
                     phrase = i + 1,
@@ -234,7 +255,9 @@ pub(super) async fn speak(shared: &Arc<PipelineShared>, text: &str) -> Result<()
         }
     }
 
-    // Drop sender to signal playback thread that no more chunks are coming
+    // Abandon any syntheses still in flight (cancel/closed channel), then drop
+    // the sender to signal the playback thread that no more chunks are coming
+    drop(synthesized);
     drop(chunk_tx);
 
     // Wait for playback to finish
@@ -361,6 +384,7 @@ pub(crate) fn restore_tts_engine(shared: &Arc<PipelineShared>, engine: Box<dyn T
             tracing::error!("Failed to lock tts_engine to restore: {}", e);
         }
     }
+    shared.tts_idle.notify_waiters();
 }
 
 /// Transition the pipeline out of Speaking state.
@@ -402,6 +426,7 @@ pub(crate) fn finish_speaking(shared: &Arc<PipelineShared>) {
     } else {
         tracing::debug!("finish_speaking: state already changed (barge-in?), skipping state transition");
     }
+    shared.tts_idle.notify_waiters();
 }
 
 /// Open the audio output stream for a named or default device.
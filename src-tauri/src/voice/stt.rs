@@ -298,6 +298,39 @@ mod whisper_real {
     unsafe impl Send for WhisperInner {}
     unsafe impl Sync for WhisperInner {}
 
+    impl WhisperInner {
+        /// Return the cached WhisperState, creating it on first use.
+        fn state(&mut self) -> Result<&mut whisper_rs::WhisperState, SttError> {
+            if self.cached_state.is_none() {
+                tracing::info!("Creating whisper state");
+                let s = self.ctx.create_state().map_err(|e| {
+                    SttError::TranscriptionError(format!(
+                        "Failed to create whisper state: {}",
+                        e
+                    ))
+                })?;
+                self.cached_state = Some(s);
+            }
+            Ok(self.cached_state.as_mut().unwrap())
+        }
+    }
+
+    /// Inference parameters shared by transcription and warm-up.
+    fn full_params(n_threads: i32) -> FullParams<'static, 'static> {
+        let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
+        params.set_language(Some("en"));
+        params.set_n_threads(n_threads);
+        params.set_print_special(false);
+        params.set_print_progress(false);
+        params.set_print_realtime(false);
+        params.set_print_timestamps(false);
+        params.set_single_segment(true);
+        params.set_no_timestamps(true);
+        // Suppress non-speech tokens to reduce hallucination on silence
+        params.set_suppress_nst(true);
+        params
+    }
+
     /// Local Whisper-based STT engine using whisper-rs (whisper.cpp FFI).
     ///
     /// Loads a GGML model file and runs inference on 16kHz mono f32 audio.
@@ -348,7 +381,7 @@ mod whisper_real {
                 "WhisperStt loaded (real whisper-rs)"
             );
 
-            Ok(Self {
+            let stt = Self {
                 inner: Arc::new(Mutex::new(WhisperInner {
                     ctx,
                     cached_state: None,
@@ -357,7 +390,45 @@ mod whisper_real {
                 model_size,
                 ready: AtomicBool::new(true),
                 streaming_buffer: Mutex::new(Vec::new()),
-            })
+            };
+
+            let inner = Arc::clone(&stt.inner);
+            let spawned = std::thread::Builder::new()
+                .name("whisper-warm-up".into())
+                .spawn(move || Self::warm_up(&inner, n_threads));
+            if spawned.is_err() {
+                tracing::warn!("Failed to spawn Whisper warm-up thread");
+            }
+            Ok(stt)
+        }
+
+        /// Run one second of silence through the model after load.
+        ///
+        /// Allocates the cached WhisperState and initializes the compute
+        /// backend (GPU kernels, scratch buffers) before the first
+        /// utterance. Runs on its own thread so loading returns without
+        /// waiting for it; a transcription that arrives meanwhile waits on
+        /// the inner lock instead. Failure is logged and left to the real
+        /// transcription to surface.
+        fn warm_up(inner: &Mutex<WhisperInner>, n_threads: i32) {
+            let start = std::time::Instant::now();
+            let mut guard = inner.lock().unwrap_or_else(|e| e.into_inner());
+            let silence = vec![0.0f32; 16_000];
+            let result = guard.state().and_then(|state| {
+                state
+                    .full(full_params(n_threads), &silence)
+                    .map(|_| ())
+                    .map_err(|e| {
+                        SttError::TranscriptionError(format!("Whisper inference failed: {}", e))
+                    })
+            });
+            match result {
+                Ok(()) => tracing::info!(
+                    elapsed_ms = start.elapsed().as_millis() as u64,
+                    "Whisper warm-up complete"
+                ),
+                Err(e) => tracing::warn!(error = %e, "Whisper warm-up failed"),
+            }
         }
 
         /// Create from a model size name, resolving the path in the data directory.
@@ -403,37 +474,11 @@ mod whisper_real {
                 SttError::TranscriptionError(format!("Failed to lock whisper context: {}", e))
             })?;
 
-            // Lazily create or reuse the cached WhisperState
-            let state = match guard.cached_state.as_mut() {
-                Some(s) => s,
-                None => {
-                    tracing::info!("Creating whisper state (first transcription)");
-                    let s = guard.ctx.create_state().map_err(|e| {
-                        SttError::TranscriptionError(format!(
-                            "Failed to create whisper state: {}",
-                            e
-                        ))
-                    })?;
-                    guard.cached_state = Some(s);
-                    guard.cached_state.as_mut().unwrap()
-                }
-            };
-
-            // Configure inference parameters
-            let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
-            params.set_language(Some("en"));
-            params.set_n_threads(self.n_threads);
-            params.set_print_special(false);
-            params.set_print_progress(false);
-            params.set_print_realtime(false);
-            params.set_print_timestamps(false);
-            params.set_single_segment(true);
-            params.set_no_timestamps(true);
-            // Suppress non-speech tokens to reduce hallucination on silence
-            params.set_suppress_nst(true);
+            // Reuse the cached WhisperState (created during warm-up)
+            let state = guard.state()?;
 
             // Run inference
-            state.full(params, audio).map_err(|e| {
+            state.full(full_params(self.n_threads), audio).map_err(|e| {
                 SttError::TranscriptionError(format!("Whisper inference failed: {}", e))
             })?;
 
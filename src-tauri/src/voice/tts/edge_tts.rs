@@ -11,11 +11,12 @@
 //! HTTP upgrade mechanism to get a raw byte stream, then implement
 //! minimal WebSocket framing on top. This avoids adding `tokio-tungstenite`.
 
+use std::collections::VecDeque;
 use std::future::Future;
 use std::pin::Pin;
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::Arc;
-use std::time::{SystemTime, UNIX_EPOCH};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{LazyLock, Mutex};
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use super::crypto::{base64_encode, hex_encode_upper, sha256};
 use super::mp3_decode::decode_mp3_to_f32;
@@ -23,10 +24,33 @@ use super::{TtsEngine, TtsError};
 
 // ── Edge TTS DRM Token ──────────────────────────────────────────────
 
-const TRUSTED_CLIENT_TOKEN: &str = "6A5AA1D4EAFF4E9FB37E23D68491D6F4";
+macro_rules! trusted_client_token {
+    () => {
+        "6A5AA1D4EAFF4E9FB37E23D68491D6F4"
+    };
+}
+const TRUSTED_CLIENT_TOKEN: &str = trusted_client_token!();
+/// Fixed part of the synthesis endpoint URL, up to the per-connection ID.
+const EDGE_WS_URL_PREFIX: &str = concat!(
+    "https://speech.platform.bing.com/consumer/speech/synthesize/readaloud/edge/v1",
+    "?TrustedClientToken=",
+    trusted_client_token!(),
+    "&ConnectionId="
+);
+/// Fixed URL suffix following the Sec-MS-GEC token.
+const EDGE_WS_URL_VERSION: &str = "&Sec-MS-GEC-Version=1-143.0.3650.75";
 /// Windows epoch offset: seconds between 1601-01-01 and 1970-01-01.
 const WIN_EPOCH: u64 = 11_644_473_600;
 
+/// `speech.config` message sent at the start of every connection.
+const SPEECH_CONFIG_MSG: &str =
+    "X-Timestamp:Thu Jan 01 1970 00:00:00 GMT+0000 (Coordinated Universal Time)\r\n\
+     Content-Type:application/json; charset=utf-8\r\n\
+     Path:speech.config\r\n\r\n\
+     {\"context\":{\"synthesis\":{\"audio\":{\"metadataoptions\":\
+     {\"sentenceBoundaryEnabled\":\"false\",\"wordBoundaryEnabled\":\"false\"},\
+     \"outputFormat\":\"audio-24khz-48kbitrate-mono-mp3\"}}}}";
+
 /// Generate the Sec-MS-GEC security token for Edge TTS.
 ///
 /// Replicates the Python `edge-tts` DRM logic:
@@ -49,9 +73,8 @@ fn generate_sec_ms_gec() -> String {
 
 // ── Edge TTS Helpers ────────────────────────────────────────────────
 
-/// Escape XML special characters for SSML.
-fn xml_escape(s: &str) -> String {
-    let mut out = String::with_capacity(s.len());
+/// Append `s` to `out` with XML special characters escaped for SSML.
+fn xml_escape_into(out: &mut String, s: &str) {
     for c in s.chars() {
         match c {
             '&' => out.push_str("&amp;"),
@@ -62,36 +85,94 @@ fn xml_escape(s: &str) -> String {
             _ => out.push(c),
         }
     }
-    out
 }
 
+/// Opening SSML tags for a voice and rate, up to where the text goes.
+fn ssml_prefix(voice: &str, rate: i32) -> String {
+    format!(
+        "<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='en-US'>\
+         <voice name='{}'>\
+         <prosody rate='{:+}%' pitch='+0Hz'>",
+        voice, rate
+    )
+}
+
+/// Closing tags matching [`ssml_prefix`].
+const SSML_SUFFIX: &str = "</prosody></voice></speak>";
+
 // ── Edge TTS ────────────────────────────────────────────────────────
 
+/// HTTP client shared by every `EdgeTts` instance.
+///
+/// The engine is rebuilt whenever the voice or speed changes; sharing the
+/// client keeps its TLS configuration and DNS cache instead of rebuilding
+/// them each time. `reqwest::Client` is an `Arc` internally, so clones are cheap.
+/// The browser-identity headers are identical on every request, so they are
+/// installed once as client defaults.
+static EDGE_CLIENT: LazyLock<reqwest::Client> = LazyLock::new(|| {
+    use reqwest::header::{HeaderMap, HeaderValue, CACHE_CONTROL, ORIGIN, PRAGMA, USER_AGENT};
+
+    let mut headers = HeaderMap::new();
+    headers.insert(
+        ORIGIN,
+        HeaderValue::from_static("chrome-extension://jdiccldimpdaibmpdkjnbmckianbfold"),
+    );
+    headers.insert(
+        USER_AGENT,
+        HeaderValue::from_static(
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 \
+             (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36 Edg/143.0.0.0",
+        ),
+    );
+    headers.insert(PRAGMA, HeaderValue::from_static("no-cache"));
+    headers.insert(CACHE_CONTROL, HeaderValue::from_static("no-cache"));
+
+    reqwest::Client::builder()
+        .default_headers(headers)
+        .timeout(std::time::Duration::from_secs(30))
+        .connect_timeout(std::time::Duration::from_secs(10))
+        .build()
+        .unwrap_or_else(|_| reqwest::Client::new())
+});
+
+/// Maximum number of idle WebSocket connections kept per engine.
+const MAX_IDLE_CONNECTIONS: usize = 4;
+
+/// Idle connections older than this are dropped rather than reused; the
+/// service closes quiet sockets on its side and a stale one costs a retry.
+const MAX_IDLE_AGE: Duration = Duration::from_secs(20);
+
+/// Phrases up to this many bytes are kept in the phrase cache.
+const MAX_CACHED_PHRASE_LEN: usize = 48;
+
+/// Number of short phrases kept in the phrase cache.
+const PHRASE_CACHE_CAPACITY: usize = 16;
+
 /// Microsoft Edge TTS engine using the free cloud API.
 pub struct EdgeTts {
     /// Voice name (e.g., "en-US-AriaNeural", "en-US-GuyNeural").
     voice: String,
-    /// Speech rate as percentage offset (e.g., 0 for normal, 50 for 1.5x).
-    rate: i32,
-    /// Cancellation flag.
-    cancelled: Arc<AtomicBool>,
-    /// HTTP client (reused across requests).
+    /// SSML opening tags for this voice/rate, built once.
+    ssml_prefix: String,
+    /// Incremented by `stop()`. Each synthesis records the value it started
+    /// under and is cancelled once it changes, so phrases synthesized
+    /// concurrently cannot clear each other's cancellation.
+    stop_epoch: AtomicU64,
+    /// HTTP client (shared across requests and engine instances).
     client: reqwest::Client,
+    /// Upgraded WebSocket streams that finished a clean turn, with the time
+    /// they went idle. Reusing them skips the TLS + upgrade handshake.
+    idle: Mutex<Vec<(reqwest::Upgraded, Instant)>>,
+    /// Recently synthesized short phrases ("Okay.", "Let me check."), least
+    /// recently used first. Voice and rate are fixed per engine, so the text
+    /// alone is the key.
+    phrase_cache: Mutex<VecDeque<(String, Vec<f32>)>>,
 }
 
 impl EdgeTts {
     /// Create a new Edge TTS engine with the given voice.
     pub fn new(voice: &str) -> Self {
-        Self {
-            voice: voice.to_string(),
-            rate: 0,
-            cancelled: Arc::new(AtomicBool::new(false)),
-            client: reqwest::Client::builder()
-                .timeout(std::time::Duration::from_secs(30))
-                .connect_timeout(std::time::Duration::from_secs(10))
-                .build()
-                .unwrap_or_else(|_| reqwest::Client::new()),
-        }
+        Self::with_rate(voice, 0)
     }
 
     /// Create a new Edge TTS engine with voice and rate.
@@ -100,33 +181,22 @@ impl EdgeTts {
     pub fn with_rate(voice: &str, rate: i32) -> Self {
         Self {
             voice: voice.to_string(),
-            rate,
-            cancelled: Arc::new(AtomicBool::new(false)),
-            client: reqwest::Client::builder()
-                .timeout(std::time::Duration::from_secs(30))
-                .connect_timeout(std::time::Duration::from_secs(10))
-                .build()
-                .unwrap_or_else(|_| reqwest::Client::new()),
+            ssml_prefix: ssml_prefix(voice, rate),
+            stop_epoch: AtomicU64::new(0),
+            client: EDGE_CLIENT.clone(),
+            idle: Mutex::new(Vec::new()),
+            phrase_cache: Mutex::new(VecDeque::new()),
         }
     }
 
     /// Build SSML for the given text.
     fn build_ssml(&self, text: &str) -> String {
-        let escaped = xml_escape(text);
-        let rate_str = if self.rate >= 0 {
-            format!("+{}%", self.rate)
-        } else {
-            format!("{}%", self.rate)
-        };
-
-        format!(
-            "<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='en-US'>\
-             <voice name='{}'>\
-             <prosody rate='{}' pitch='+0Hz'>{}</prosody>\
-             </voice>\
-             </speak>",
-            self.voice, rate_str, escaped
-        )
+        let mut ssml =
+            String::with_capacity(self.ssml_prefix.len() + text.len() + SSML_SUFFIX.len());
+        ssml.push_str(&self.ssml_prefix);
+        xml_escape_into(&mut ssml, text);
+        ssml.push_str(SSML_SUFFIX);
+        ssml
     }
 
     /// Perform TTS synthesis via WebSocket using reqwest HTTP upgrade.
@@ -135,19 +205,128 @@ impl EdgeTts {
     /// then speaks the minimal WebSocket framing protocol on the upgraded
     /// raw byte stream. This avoids adding tokio-tungstenite while
     /// leveraging reqwest's existing TLS support.
-    async fn synthesize_ws(&self, text: &str) -> Result<Vec<f32>, TtsError> {
+    ///
+    /// An idle connection from a previous phrase is reused when available.
+    /// If a reused connection fails before yielding any audio (typically
+    /// because the server already closed it), the phrase is retried once on
+    /// a fresh connection.
+    async fn synthesize_ws(&self, text: &str, epoch: u64) -> Result<Vec<f32>, TtsError> {
+        let mut mp3_data = Vec::new();
+        let mut clean_end = false;
+        let mut ws = None;
+
+        if let Some(mut pooled) = self.take_idle() {
+            match self.run_turn(&mut pooled, text, epoch, &mut mp3_data).await {
+                Ok(done) => {
+                    clean_end = done;
+                    ws = Some(pooled);
+                }
+                Err(e) => tracing::debug!("Edge TTS: reused connection failed: {}", e),
+            }
+            if mp3_data.is_empty() && !self.is_stopped(epoch) {
+                tracing::debug!("Edge TTS: retrying on a fresh connection");
+                ws = None;
+            }
+        }
+
+        if ws.is_none() && !self.is_stopped(epoch) {
+            let mut fresh = self.connect().await?;
+            clean_end = self.run_turn(&mut fresh, text, epoch, &mut mp3_data).await?;
+            ws = Some(fresh);
+        }
+
+        // Only a connection that saw turn.end is at a message boundary.
+        if clean_end {
+            if let Some(ws) = ws {
+                self.put_idle(ws);
+            }
+        }
+
+        if mp3_data.is_empty() {
+            return Err(TtsError::NetworkError(
+                "Edge TTS: no audio data received".into(),
+            ));
+        }
+
+        // Decode MP3 to f32 PCM
+        let samples = decode_mp3_to_f32(&mp3_data)?;
+        tracing::info!(
+            mp3_bytes = mp3_data.len(),
+            pcm_samples = samples.len(),
+            "Edge TTS synthesis complete"
+        );
+        // Audio from an interrupted turn may be truncated; never cache it.
+        if clean_end && text.len() <= MAX_CACHED_PHRASE_LEN {
+            self.cache_phrase(text, &samples);
+        }
+        Ok(samples)
+    }
+
+    /// Look up a short phrase in the cache, marking it most recently used.
+    fn cached_phrase(&self, text: &str) -> Option<Vec<f32>> {
+        let mut cache = self.phrase_cache.lock().unwrap_or_else(|e| e.into_inner());
+        let pos = cache.iter().position(|(t, _)| t == text)?;
+        let entry = cache.remove(pos)?;
+        let samples = entry.1.clone();
+        cache.push_back(entry);
+        Some(samples)
+    }
+
+    /// Remember the audio for a short phrase, evicting the least recently used.
+    fn cache_phrase(&self, text: &str, samples: &[f32]) {
+        let mut cache = self.phrase_cache.lock().unwrap_or_else(|e| e.into_inner());
+        if cache.iter().any(|(t, _)| t == text) {
+            return;
+        }
+        if cache.len() >= PHRASE_CACHE_CAPACITY {
+            cache.pop_front();
+        }
+        cache.push_back((text.to_string(), samples.to_vec()));
+    }
+
+    /// Whether `stop()` has been called since a synthesis started at `epoch`.
+    fn is_stopped(&self, epoch: u64) -> bool {
+        self.stop_epoch.load(Ordering::SeqCst) != epoch
+    }
+
+    /// Take the most recently idled connection that is still young enough.
+    fn take_idle(&self) -> Option<reqwest::Upgraded> {
+        let mut idle = self.idle.lock().unwrap_or_else(|e| e.into_inner());
+        while let Some((ws, since)) = idle.pop() {
+            if since.elapsed() < MAX_IDLE_AGE {
+                return Some(ws);
+            }
+        }
+        None
+    }
+
+    /// Return a connection to the idle pool, dropping it if the pool is full.
+    fn put_idle(&self, ws: reqwest::Upgraded) {
+        let mut idle = self.idle.lock().unwrap_or_else(|e| e.into_inner());
+        idle.retain(|(_, since)| since.elapsed() < MAX_IDLE_AGE);
+        if idle.len() < MAX_IDLE_CONNECTIONS {
+            idle.push((ws, Instant::now()));
+        }
+    }
+
+    /// Open a new WebSocket connection and send the `speech.config` message.
+    async fn connect(&self) -> Result<reqwest::Upgraded, TtsError> {
         let connection_id = uuid::Uuid::new_v4().as_simple().to_string();
         let sec_ms_gec = generate_sec_ms_gec();
         let ws_key = base64_encode(&uuid::Uuid::new_v4().as_bytes()[..16]);
 
-        let url = format!(
-            "https://speech.platform.bing.com/consumer/speech/synthesize/readaloud/edge/v1\
-             ?TrustedClientToken={}\
-             &ConnectionId={}\
-             &Sec-MS-GEC={}\
-             &Sec-MS-GEC-Version=1-143.0.3650.75",
-            TRUSTED_CLIENT_TOKEN, connection_id, sec_ms_gec,
+        let mut url = String::with_capacity(
+            EDGE_WS_URL_PREFIX.len()
+                + connection_id.len()
+                + "&Sec-MS-GEC=".len()
+                + sec_ms_gec.len()
+                + EDGE_WS_URL_VERSION.len(),
         );
+        url.push_str(EDGE_WS_URL_PREFIX);
+        url.push_str(&connection_id);
+        url.push_str("&Sec-MS-GEC=");
+        url.push_str(&sec_ms_gec);
+        url.push_str(EDGE_WS_URL_VERSION);
 
         // Send WebSocket upgrade via reqwest
         let response = self
@@ -157,17 +336,6 @@ impl EdgeTts {
             .header("Connection", "Upgrade")
             .header("Sec-WebSocket-Key", &ws_key)
             .header("Sec-WebSocket-Version", "13")
-            .header(
-                "Origin",
-                "chrome-extension://jdiccldimpdaibmpdkjnbmckianbfold",
-            )
-            .header(
-                "User-Agent",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 \
-                 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36 Edg/143.0.0.0",
-            )
-            .header("Pragma", "no-cache")
-            .header("Cache-Control", "no-cache")
             .send()
             .await
             .map_err(|e| TtsError::NetworkError(format!("Edge TTS request failed: {}", e)))?;
@@ -186,18 +354,25 @@ impl EdgeTts {
             .await
             .map_err(|e| TtsError::NetworkError(format!("Edge TTS stream upgrade failed: {}", e)))?;
 
-        // Send speech.config message
-        let request_id = uuid::Uuid::new_v4().as_simple().to_string();
-        let config_msg =
-            "X-Timestamp:Thu Jan 01 1970 00:00:00 GMT+0000 (Coordinated Universal Time)\r\n\
-             Content-Type:application/json; charset=utf-8\r\n\
-             Path:speech.config\r\n\r\n\
-             {\"context\":{\"synthesis\":{\"audio\":{\"metadataoptions\":\
-             {\"sentenceBoundaryEnabled\":\"false\",\"wordBoundaryEnabled\":\"false\"},\
-             \"outputFormat\":\"audio-24khz-48kbitrate-mono-mp3\"}}}}".to_string();
-        ws_send_text(&mut upgraded, &config_msg).await?;
+        // speech.config applies to the whole connection
+        ws_send_text(&mut upgraded, SPEECH_CONFIG_MSG).await?;
+        Ok(upgraded)
+    }
 
+    /// Send one SSML request on `ws` and append the returned MP3 audio to
+    /// `mp3_data`.
+    ///
+    /// Returns `Ok(true)` when the turn ended with `turn.end`, meaning the
+    /// connection is idle and can be reused.
+    async fn run_turn(
+        &self,
+        ws: &mut reqwest::Upgraded,
+        text: &str,
+        epoch: u64,
+        mp3_data: &mut Vec<u8>,
+    ) -> Result<bool, TtsError> {
         // Send SSML request
+        let request_id = uuid::Uuid::new_v4().as_simple().to_string();
         let ssml = self.build_ssml(text);
         let ssml_msg = format!(
             "X-RequestId:{}\r\n\
@@ -207,29 +382,25 @@ impl EdgeTts {
              {}",
             request_id, ssml
         );
-        ws_send_text(&mut upgraded, &ssml_msg).await?;
+        ws_send_text(ws, &ssml_msg).await?;
 
         // Receive audio frames
-        let mut mp3_data = Vec::new();
         loop {
-            if self.cancelled.load(Ordering::SeqCst) {
+            if self.is_stopped(epoch) {
                 tracing::debug!("Edge TTS interrupted by user");
-                break;
+                return Ok(false);
             }
 
             // Bound the read so a network stall mid-frame can't wedge the pipeline
             // in the Speaking state forever (cancel is only checked between frames).
-            let frame = match tokio::time::timeout(
-                std::time::Duration::from_secs(10),
-                ws_read_frame(&mut upgraded),
-            )
-            .await
+            let frame = match tokio::time::timeout(Duration::from_secs(10), ws_read_frame(ws))
+                .await
             {
                 Ok(Ok(f)) => f,
-                Ok(Err(_)) => break, // connection closed or error
+                Ok(Err(_)) => return Ok(false), // connection closed or error
                 Err(_) => {
                     tracing::warn!("Edge TTS: frame read timed out — ending synthesis");
-                    break;
+                    return Ok(false);
                 }
             };
 
@@ -237,7 +408,7 @@ impl EdgeTts {
                 WsFrame::Text(txt) => {
                     if txt.contains("Path:turn.end") {
                         tracing::debug!("Edge TTS: turn.end received");
-                        break;
+                        return Ok(true);
                     }
                 }
                 WsFrame::Binary(data) => {
@@ -264,28 +435,13 @@ impl EdgeTts {
                 }
                 WsFrame::Close => {
                     tracing::debug!("Edge TTS: WebSocket closed");
-                    break;
+                    return Ok(false);
                 }
                 WsFrame::Ping(payload) => {
-                    let _ = ws_send_pong(&mut upgraded, &payload).await;
+                    let _ = ws_send_pong(ws, &payload).await;
                 }
             }
         }
-
-        if mp3_data.is_empty() {
-            return Err(TtsError::NetworkError(
-                "Edge TTS: no audio data received".into(),
-            ));
-        }
-
-        // Decode MP3 to f32 PCM
-        let samples = decode_mp3_to_f32(&mp3_data)?;
-        tracing::info!(
-            mp3_bytes = mp3_data.len(),
-            pcm_samples = samples.len(),
-            "Edge TTS synthesis complete"
-        );
-        Ok(samples)
     }
 }
 
@@ -296,11 +452,7 @@ impl TtsEngine for EdgeTts {
     ) -> Pin<Box<dyn Future<Output = Result<Vec<f32>, TtsError>> + Send + '_>> {
         let text = text.to_string();
         Box::pin(async move {
-            self.cancelled.store(false, Ordering::SeqCst);
-
-            if self.cancelled.load(Ordering::SeqCst) {
-                return Err(TtsError::Cancelled);
-            }
+            let epoch = self.stop_epoch.load(Ordering::SeqCst);
 
             if text.trim().is_empty() {
                 return Ok(Vec::new());
@@ -312,12 +464,19 @@ impl TtsEngine for EdgeTts {
                 "Edge TTS synthesis request"
             );
 
-            self.synthesize_ws(&text).await
+            if text.len() <= MAX_CACHED_PHRASE_LEN {
+                if let Some(samples) = self.cached_phrase(&text) {
+                    tracing::debug!(text_len = text.len(), "Edge TTS phrase cache hit");
+                    return Ok(samples);
+                }
+            }
+
+            self.synthesize_ws(&text, epoch).await
         })
     }
 
     fn stop(&self) {
-        self.cancelled.store(true, Ordering::SeqCst);
+        self.stop_epoch.fetch_add(1, Ordering::SeqCst);
     }
 
     fn name(&self) -> String {
@@ -327,6 +486,11 @@ impl TtsEngine for EdgeTts {
     fn sample_rate(&self) -> u32 {
         24000
     }
+
+    fn synthesis_concurrency(&self) -> usize {
+        // Synthesis is a network round trip per phrase; overlap a few.
+        3
+    }
 }
 
 // ── Minimal WebSocket Helpers ───────────────────────────────────────
@@ -369,41 +533,34 @@ async fn ws_send_frame<W: tokio::io::AsyncWrite + Unpin>(
     use tokio::io::AsyncWriteExt;
 
     let len = payload.len();
-    let mut header = Vec::with_capacity(14);
+    // Header (at most 14 bytes) and masked payload go out in one write.
+    let mut frame = Vec::with_capacity(14 + len);
 
     // FIN bit + opcode
-    header.push(0x80 | opcode);
+    frame.push(0x80 | opcode);
 
     // Payload length with mask bit set
     if len < 126 {
-        header.push(0x80 | len as u8);
+        frame.push(0x80 | len as u8);
     } else if len <= 65535 {
-        header.push(0x80 | 126);
-        header.extend_from_slice(&(len as u16).to_be_bytes());
+        frame.push(0x80 | 126);
+        frame.extend_from_slice(&(len as u16).to_be_bytes());
     } else {
-        header.push(0x80 | 127);
-        header.extend_from_slice(&(len as u64).to_be_bytes());
+        frame.push(0x80 | 127);
+        frame.extend_from_slice(&(len as u64).to_be_bytes());
     }
 
     // Masking key (use a simple deterministic key -- Edge doesn't check)
     let mask_key: [u8; 4] = [0x37, 0xfa, 0x21, 0x3d];
-    header.extend_from_slice(&mask_key);
+    frame.extend_from_slice(&mask_key);
 
-    // Write header
-    writer
-        .write_all(&header)
-        .await
-        .map_err(|e| TtsError::NetworkError(format!("WS write header failed: {}", e)))?;
+    // Masked payload
+    frame.extend(payload.iter().zip(mask_key.iter().cycle()).map(|(b, m)| b ^ m));
 
-    // Write masked payload
-    let mut masked = Vec::with_capacity(len);
-    for (i, &b) in payload.iter().enumerate() {
-        masked.push(b ^ mask_key[i % 4]);
-    }
     writer
-        .write_all(&masked)
+        .write_all(&frame)
         .await
-        .map_err(|e| TtsError::NetworkError(format!("WS write payload failed: {}", e)))?;
+        .map_err(|e| TtsError::NetworkError(format!("WS write frame failed: {}", e)))?;
 
     Ok(())
 }
@@ -492,6 +649,33 @@ mod tests {
         assert_eq!(engine.sample_rate(), 24000);
     }
 
+    #[test]
+    fn test_stop_cancels_syntheses_in_flight() {
+        let engine = EdgeTts::new("en-US-AriaNeural");
+        let first = engine.stop_epoch.load(Ordering::SeqCst);
+        assert!(!engine.is_stopped(first));
+        engine.stop();
+        assert!(engine.is_stopped(first));
+        let second = engine.stop_epoch.load(Ordering::SeqCst);
+        assert!(!engine.is_stopped(second));
+        assert!(engine.is_stopped(first));
+    }
+
+    #[test]
+    fn test_phrase_cache_evicts_least_recently_used() {
+        let engine = EdgeTts::new("en-US-AriaNeural");
+        for i in 0..PHRASE_CACHE_CAPACITY {
+            engine.cache_phrase(&format!("phrase {}", i), &[i as f32]);
+        }
+        // Touch the oldest entry so the second-oldest is evicted instead.
+        assert_eq!(engine.cached_phrase("phrase 0"), Some(vec![0.0]));
+        engine.cache_phrase("new phrase", &[42.0]);
+
+        assert_eq!(engine.cached_phrase("phrase 0"), Some(vec![0.0]));
+        assert_eq!(engine.cached_phrase("phrase 1"), None);
+        assert_eq!(engine.cached_phrase("new phrase"), Some(vec![42.0]));
+    }
+
     #[test]
     fn test_sec_ms_gec_format() {
         // The DRM token should be a 64-char uppercase hex string
@@ -513,13 +697,50 @@ mod tests {
         let ssml_fast = engine_fast.build_ssml("Test & <escape>");
         assert!(ssml_fast.contains("rate='+50%'"));
         assert!(ssml_fast.contains("Test &amp; &lt;escape&gt;"));
+
+        let engine_slow = EdgeTts::with_rate("en-US-GuyNeural", -25);
+        let ssml_slow = engine_slow.build_ssml("Hi");
+        assert!(ssml_slow.contains("rate='-25%'"));
+        assert!(ssml_slow.ends_with("Hi</prosody></voice></speak>"));
+    }
+
+    #[test]
+    fn test_ws_url_prefix() {
+        assert!(EDGE_WS_URL_PREFIX.starts_with("https://speech.platform.bing.com/"));
+        assert!(EDGE_WS_URL_PREFIX.contains(TRUSTED_CLIENT_TOKEN));
+        assert!(EDGE_WS_URL_PREFIX.ends_with("&ConnectionId="));
+    }
+
+    #[tokio::test]
+    async fn test_ws_send_frame_layout() {
+        let mut out = Vec::new();
+        ws_send_text(&mut out, "hi").await.unwrap();
+        assert_eq!(out[0], 0x81); // FIN + text
+        assert_eq!(out[1], 0x80 | 2); // masked, len 2
+        let mask = [out[2], out[3], out[4], out[5]];
+        assert_eq!(out[6] ^ mask[0], b'h');
+        assert_eq!(out[7] ^ mask[1], b'i');
+        assert_eq!(out.len(), 8);
+
+        let mut out = Vec::new();
+        ws_send_text(&mut out, &"x".repeat(300)).await.unwrap();
+        assert_eq!(out[1], 0x80 | 126);
+        assert_eq!(u16::from_be_bytes([out[2], out[3]]), 300);
+        assert_eq!(out.len(), 2 + 2 + 4 + 300);
     }
 
     #[test]
-    fn test_xml_escape() {
-        assert_eq!(xml_escape("hello"), "hello");
-        assert_eq!(xml_escape("a & b"), "a &amp; b");
-        assert_eq!(xml_escape("<tag>"), "&lt;tag&gt;");
-        assert_eq!(xml_escape("it's \"fine\""), "it&apos;s &quot;fine&quot;");
+    fn test_xml_escape_into() {
+        let mut out = String::new();
+        xml_escape_into(&mut out, "hello");
+        assert_eq!(out, "hello");
+
+        let mut out = String::new();
+        xml_escape_into(&mut out, "it's \"fine\" & <ok>");
+        assert_eq!(out, "it&apos;s &quot;fine&quot; &amp; &lt;ok&gt;");
+
+        let mut out = String::from("<prosody>");
+        xml_escape_into(&mut out, "a & b");
+        assert_eq!(out, "<prosody>a &amp; b");
     }
 }
@@ -13,6 +13,7 @@ mod inner {
     use std::process::Command;
     use std::sync::atomic::{AtomicBool, Ordering};
     use std::sync::{Arc, Mutex};
+    use std::time::{Duration, Instant};
 
     use byteorder::{LittleEndian, ReadBytesExt};
     use tracing::{debug, info, warn};
@@ -24,6 +25,8 @@ mod inner {
     const MAX_PHONEME_TOKENS: usize = 510;
     /// Style embedding dimension.
     const STYLE_DIM: usize = 256;
+    /// How long a failed espeak-ng lookup is remembered before probing again.
+    const ESPEAK_MISSING_TTL_SECS: u64 = 10;
 
     /// Per-voice style embeddings: maps voice name -> flat f32 array of shape (N, 1, 256).
     struct VoiceData {
@@ -87,10 +90,23 @@ mod inner {
                 )));
             }
 
+            // Leave half the cores for Whisper and the audio threads; full
+            // graph optimization is a one-off cost at load time.
+            let intra_threads = std::thread::available_parallelism()
+                .map(|n| (n.get() / 2).max(1))
+                .unwrap_or(1);
             let session = ort::session::Session::builder()
                 .map_err(|e| {
                     TtsError::SynthesisError(format!("ONNX session builder failed: {}", e))
                 })?
+                .with_optimization_level(ort::session::builder::GraphOptimizationLevel::Level3)
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("ONNX optimization level failed: {}", e))
+                })?
+                .with_intra_threads(intra_threads)
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("ONNX thread config failed: {}", e))
+                })?
                 .commit_from_file(&model_path)
                 .map_err(|e| {
                     TtsError::SynthesisError(format!("ONNX model load failed: {}", e))
@@ -105,14 +121,44 @@ mod inner {
 
             let vocab = build_vocab();
 
-            Ok(Self {
+            let engine = Self {
                 voice: Mutex::new(voice.to_string()),
                 speed,
                 cancelled: Arc::new(AtomicBool::new(false)),
                 session: Mutex::new(session),
                 voices,
                 vocab,
-            })
+            };
+            engine.warm_up();
+            Ok(engine)
+        }
+
+        /// Run one tiny inference so ONNX Runtime allocates its arenas and
+        /// picks kernels now, rather than during the first real phrase.
+        fn warm_up(&self) {
+            let voice_name = match self.voice.lock() {
+                Ok(g) => g.clone(),
+                Err(_) => return,
+            };
+            let Some(voice_data) = self
+                .voices
+                .get(&voice_name)
+                .or_else(|| self.voices.values().next())
+            else {
+                return;
+            };
+
+            // Pre-phonemized "hello", so warm-up doesn't depend on espeak-ng.
+            let tokens = self.tokenize("h\u{0259}l\u{02c8}o\u{028a}");
+            let start = Instant::now();
+            let mut audio = Vec::new();
+            match self.infer_chunk(&tokens, voice_data, &mut audio) {
+                Ok(()) => debug!(
+                    elapsed_ms = start.elapsed().as_millis() as u64,
+                    "Kokoro warm-up done"
+                ),
+                Err(e) => warn!("Kokoro warm-up inference failed: {}", e),
+            }
         }
 
         /// Change the active voice.
@@ -128,8 +174,33 @@ mod inner {
             self.speed = speed;
         }
 
-        /// Find espeak-ng executable.
+        /// Find espeak-ng executable, probing until it is found once.
+        ///
+        /// The probe runs `espeak-ng --version`, an extra process spawn that
+        /// used to happen before every phonemization. A hit is remembered for
+        /// good; a miss only for `ESPEAK_MISSING_TTL_SECS`, so installing
+        /// espeak-ng takes effect without restarting the app while phrases
+        /// synthesized meanwhile don't each re-run the probe.
         fn find_espeak_ng() -> Option<(PathBuf, Option<PathBuf>)> {
+            type Found = Option<(PathBuf, Option<PathBuf>)>;
+            static ESPEAK: Mutex<Option<(Found, Instant)>> = Mutex::new(None);
+            let mut cache = ESPEAK.lock().unwrap_or_else(|e| e.into_inner());
+
+            if let Some((found, probed_at)) = cache.as_ref() {
+                if found.is_some()
+                    || probed_at.elapsed() < Duration::from_secs(ESPEAK_MISSING_TTL_SECS)
+                {
+                    return found.clone();
+                }
+            }
+
+            let found = Self::probe_espeak_ng();
+            *cache = Some((found.clone(), Instant::now()));
+            found
+        }
+
+        /// Locate espeak-ng on PATH or in a bundled location.
+        fn probe_espeak_ng() -> Option<(PathBuf, Option<PathBuf>)> {
             // 1. Check if espeak-ng is on PATH
             let mut version_cmd = Command::new("espeak-ng");
             version_cmd.arg("--version");
@@ -170,23 +241,34 @@ mod inner {
         }
 
         /// Convert text to IPA phonemes using espeak-ng CLI.
-        fn phonemize(text: &str, lang: &str) -> Result<String, TtsError> {
-            let (espeak_bin, data_path) = Self::find_espeak_ng().ok_or_else(|| {
+        ///
+        /// Runs the process through tokio so the runtime thread is free while
+        /// espeak-ng works; dropping the future (cancel) kills the process.
+        /// The lookup may spawn a blocking `--version` probe, so it runs on
+        /// the blocking pool too.
+        async fn phonemize(text: &str, lang: &str) -> Result<String, TtsError> {
+            let found = tokio::task::spawn_blocking(Self::find_espeak_ng)
+                .await
+                .map_err(|e| {
+                    TtsError::SynthesisError(format!("espeak-ng lookup failed: {}", e))
+                })?;
+            let (espeak_bin, data_path) = found.ok_or_else(|| {
                 TtsError::SynthesisError(
                     "espeak-ng not found. Install espeak-ng or place it in tools/espeak-ng/"
                         .into(),
                 )
             })?;
 
-            let mut cmd = Command::new(&espeak_bin);
-            cmd.args(["--ipa", "-q", "-v", lang]).arg(text);
+            let mut cmd = tokio::process::Command::new(&espeak_bin);
+            cmd.args(["--ipa", "-q", "-v", lang]).arg(text).kill_on_drop(true);
 
             if let Some(ref data) = data_path {
                 cmd.env("ESPEAK_DATA_PATH", data);
             }
 
-            crate::util::hidden(&mut cmd);
-            match cmd.output() {
+            #[cfg(windows)]
+            cmd.creation_flags(crate::util::CREATE_NO_WINDOW);
+            match cmd.output().await {
                 Ok(out) if out.status.success() => {
                     let phonemes = String::from_utf8_lossy(&out.stdout)
                         .trim()
@@ -217,12 +299,72 @@ mod inner {
                 .collect()
         }
 
-        /// Run inference for a single chunk of tokens.
+        /// Run inference for a phonemized phrase on the current thread.
+        fn synthesize_phonemes(
+            &self,
+            phonemes: &str,
+            voice_data: &VoiceData,
+        ) -> Result<Vec<f32>, TtsError> {
+            let mut tokens = self.tokenize(phonemes);
+
+            if tokens.is_empty() {
+                return Err(TtsError::SynthesisError(
+                    "No phoneme tokens for input text".into(),
+                ));
+            }
+
+            debug!(
+                phoneme_count = phonemes.len(),
+                token_count = tokens.len(),
+                "Phonemized"
+            );
+
+            let mut all_audio = Vec::new();
+            const SPACE_TOKEN: i64 = 16;
+
+            while !tokens.is_empty() {
+                if self.cancelled.load(Ordering::SeqCst) {
+                    debug!("Kokoro synthesis interrupted");
+                    break;
+                }
+
+                let chunk = if tokens.len() <= MAX_PHONEME_TOKENS {
+                    std::mem::take(&mut tokens)
+                } else {
+                    let search_end = MAX_PHONEME_TOKENS;
+                    let split_at = tokens[..search_end]
+                        .iter()
+                        .rposition(|&t| t == SPACE_TOKEN)
+                        .map(|p| p + 1)
+                        .unwrap_or(search_end);
+                    tokens.drain(..split_at).collect()
+                };
+
+                self.infer_chunk(&chunk, voice_data, &mut all_audio)?;
+            }
+
+            if all_audio.is_empty() {
+                return Err(TtsError::SynthesisError(
+                    "No audio generated for input text".into(),
+                ));
+            }
+
+            info!(
+                samples = all_audio.len(),
+                duration_secs = all_audio.len() as f64 / SAMPLE_RATE as f64,
+                "Kokoro synthesis complete"
+            );
+
+            Ok(all_audio)
+        }
+
+        /// Run inference for a single chunk of tokens, appending the audio to `out`.
         fn infer_chunk(
             &self,
             tokens: &[i64],
             voice_data: &VoiceData,
-        ) -> Result<Vec<f32>, TtsError> {
+            out: &mut Vec<f32>,
+        ) -> Result<(), TtsError> {
             let token_count = tokens.len();
             let style = voice_data.style_for_len(token_count)?;
 
@@ -280,7 +422,8 @@ mod inner {
                         e
                     ))
                 })?;
-            Ok(audio_data.to_vec())
+            out.extend_from_slice(audio_data);
+            Ok(())
         }
     }
 
@@ -314,59 +457,9 @@ mod inner {
                     _ => "en-us",
                 };
 
-                let phonemes = Self::phonemize(&text, lang)?;
-                let mut tokens = self.tokenize(&phonemes);
-
-                if tokens.is_empty() {
-                    return Err(TtsError::SynthesisError(
-                        "No phoneme tokens for input text".into(),
-                    ));
-                }
-
-                debug!(
-                    phoneme_count = phonemes.len(),
-                    token_count = tokens.len(),
-                    "Phonemized"
-                );
-
-                let mut all_audio = Vec::new();
-                const SPACE_TOKEN: i64 = 16;
-
-                while !tokens.is_empty() {
-                    if self.cancelled.load(Ordering::SeqCst) {
-                        debug!("Kokoro synthesis interrupted");
-                        break;
-                    }
-
-                    let chunk = if tokens.len() <= MAX_PHONEME_TOKENS {
-                        std::mem::take(&mut tokens)
-                    } else {
-                        let search_end = MAX_PHONEME_TOKENS;
-                        let split_at = tokens[..search_end]
-                            .iter()
-                            .rposition(|&t| t == SPACE_TOKEN)
-                            .map(|p| p + 1)
-                            .unwrap_or(search_end);
-                        tokens.drain(..split_at).collect()
-                    };
-
-                    let audio = self.infer_chunk(&chunk, voice_data)?;
-                    all_audio.extend_from_slice(&audio);
-                }
-
-                if all_audio.is_empty() {
-                    return Err(TtsError::SynthesisError(
-                        "No audio generated for input text".into(),
-                    ));
-                }
-
-                info!(
-                    samples = all_audio.len(),
-                    duration_secs = all_audio.len() as f64 / SAMPLE_RATE as f64,
-                    "Kokoro synthesis complete"
-                );
+                let phonemes = Self::phonemize(&text, lang).await?;
 
-                Ok(all_audio)
+                run_blocking(|| self.synthesize_phonemes(&phonemes, voice_data))
             })
         }
 
@@ -387,6 +480,20 @@ mod inner {
         }
     }
 
+    /// Run CPU-bound ONNX inference from async code.
+    ///
+    /// Inference blocks for the whole phrase, so on a multi-thread runtime the
+    /// worker is handed over with `block_in_place` and other tasks (playback
+    /// feed, IPC) move off it meanwhile. `block_in_place` panics on a
+    /// current-thread runtime, where there is no other worker to hand over
+    /// to; there (and outside a runtime) `f` simply runs inline.
+    fn run_blocking<R>(f: impl FnOnce() -> R) -> R {
+        match tokio::runtime::Handle::try_current().map(|h| h.runtime_flavor()) {
+            Ok(tokio::runtime::RuntimeFlavor::MultiThread) => tokio::task::block_in_place(f),
+            _ => f(),
+        }
+    }
+
     /// Load voice embeddings from an NPZ file (ZIP of .npy arrays).
     fn load_voices_npz(path: &Path) -> Result<HashMap<String, VoiceData>, TtsError> {
         let file = std::fs::File::open(path).map_err(|e| {
@@ -477,14 +584,13 @@ mod inner {
             warn!(header = %header_str, "NPY header doesn't clearly indicate float32");
         }
 
-        let remaining = data.len() - cursor.position() as usize;
-        let num_floats = remaining / 4;
-        let mut result = Vec::with_capacity(num_floats);
-        for _ in 0..num_floats {
-            result.push(cursor.read_f32::<LittleEndian>().map_err(|e| {
-                TtsError::SynthesisError(format!("NPY read f32 failed: {}", e))
-            })?);
-        }
+        // Decode the payload in one pass over fixed 4-byte chunks; the
+        // compiler turns this into a straight copy on little-endian targets.
+        let payload = &data[cursor.position() as usize..];
+        let result = payload
+            .chunks_exact(4)
+            .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+            .collect();
 
         Ok(result)
     }
@@ -610,6 +716,26 @@ mod inner {
         ];
         entries.iter().copied().collect()
     }
+
+    #[cfg(test)]
+    mod tests {
+        use super::*;
+
+        #[tokio::test(flavor = "multi_thread")]
+        async fn test_run_blocking_multi_thread() {
+            assert_eq!(run_blocking(|| 1 + 1), 2);
+        }
+
+        #[tokio::test(flavor = "current_thread")]
+        async fn test_run_blocking_current_thread() {
+            assert_eq!(run_blocking(|| 1 + 1), 2);
+        }
+
+        #[test]
+        fn test_run_blocking_outside_runtime() {
+            assert_eq!(run_blocking(|| 1 + 1), 2);
+        }
+    }
 }
 
 // ── Kokoro TTS (stub when onnx feature disabled) ────────────────────
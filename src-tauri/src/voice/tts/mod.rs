@@ -53,6 +53,16 @@ pub trait TtsEngine: Send + Sync {
         })
     }
 
+    /// How many phrases the pipeline may synthesize at once.
+    ///
+    /// Phrases are always played back in order; this only bounds how far
+    /// synthesis may run ahead. Local engines that saturate the CPU with a
+    /// single inference keep the default of 1, while network-bound engines can
+    /// raise it to overlap round trips.
+    fn synthesis_concurrency(&self) -> usize {
+        1
+    }
+
     /// Interrupt any in-progress synthesis.
     fn stop(&self);
 
@@ -250,6 +260,10 @@ pub async fn ensure_kokoro_model_exists(
         TtsError::NetworkError(format!("Failed to create Kokoro model dir: {}", e))
     })?;
 
+    // One client for every file, so the second download reuses the
+    // connections (and TLS sessions) opened for the first.
+    let client = reqwest::Client::new();
+
     for (filename, url) in KOKORO_FILES {
         let dest = model_dir.join(filename);
         if dest.exists() {
@@ -259,7 +273,6 @@ pub async fn ensure_kokoro_model_exists(
 
         tracing::info!(url = %url, dest = %dest.display(), "Downloading Kokoro file");
 
-        let client = reqwest::Client::new();
         let resp = client.get(*url).send().await.map_err(|e| {
             TtsError::NetworkError(format!("HTTP request failed for {}: {}", filename, e))
         })?;
@@ -15,49 +15,46 @@ pub fn split_into_phrases(text: &str) -> Vec<String> {
         return vec![trimmed.to_string()];
     }
 
+    // Phrases are sliced straight out of `trimmed`: `start` is the byte
+    // offset where the current phrase begins.
     let mut phrases: Vec<String> = Vec::new();
-    let mut current = String::new();
-    let chars: Vec<char> = trimmed.chars().collect();
-    let len = chars.len();
-    let mut i = 0;
+    let mut start = 0;
+    let mut chars = trimmed.char_indices().peekable();
 
-    while i < len {
-        current.push(chars[i]);
+    while let Some((i, c)) = chars.next() {
+        let end = i + c.len_utf8();
 
         // Sentence boundary: punctuation followed by whitespace or end
-        let is_punct = matches!(chars[i], '.' | '!' | '?')
-            && (i + 1 >= len || chars[i + 1].is_whitespace());
+        let is_punct = matches!(c, '.' | '!' | '?')
+            && chars.peek().map_or(true, |&(_, next)| next.is_whitespace());
 
         // Paragraph break
-        let is_para = chars[i] == '\n' && current.trim().len() > 10;
+        let is_para = c == '\n' && trimmed[start..end].trim().len() > 10;
 
         if is_punct || is_para {
-            let s = current.trim().to_string();
+            let s = trimmed[start..end].trim();
             if !s.is_empty() {
-                phrases.push(s);
+                phrases.push(s.to_string());
             }
-            current.clear();
             // Skip whitespace after boundary
-            while i + 1 < len && chars[i + 1].is_whitespace() {
-                i += 1;
-            }
+            while chars.next_if(|&(_, next)| next.is_whitespace()).is_some() {}
+            start = chars.peek().map_or(trimmed.len(), |&(j, _)| j);
         }
-        i += 1;
     }
 
     // Push remainder
-    let remainder = current.trim().to_string();
+    let remainder = trimmed[start..].trim();
     if !remainder.is_empty() {
         if remainder.len() < 15 {
             // Very short -- merge with last phrase
             if let Some(last) = phrases.last_mut() {
                 last.push(' ');
-                last.push_str(&remainder);
+                last.push_str(remainder);
             } else {
-                phrases.push(remainder);
+                phrases.push(remainder.to_string());
             }
         } else {
-            phrases.push(remainder);
+            phrases.push(remainder.to_string());
         }
     }
 
@@ -131,4 +128,18 @@ mod tests {
         assert!(joined.contains("Second"));
         assert!(joined.contains("Third"));
     }
+
+    #[test]
+    fn test_phrase_splitting_multibyte() {
+        let text = "Café crème brûlée is délicieux, répète-le. \
+                    Über naïve façades we go, déjà vu! Ça marche?";
+        let result = split_into_phrases(text);
+        assert_eq!(
+            result,
+            vec![
+                "Café crème brûlée is délicieux, répète-le.",
+                "Über naïve façades we go, déjà vu! Ça marche?",
+            ]
+        );
+    }
 }